@@ -0,0 +1,137 @@
+# -*- mode: python ; coding: utf-8 -*-
+"""
+PyInstaller spec for Music Rounds Creator (macOS and Windows)
+
+FFmpeg is deliberately not passed to Analysis: the build scripts start
+PyInstaller while FFmpeg is still downloading, and the spec only waits for
+the binary right before the bundle is collected.
+"""
+
+import os
+import sys
+
+from PyInstaller.utils.hooks import collect_all, collect_data_files
+
+if sys.platform == "win32":
+    ffmpeg_name = 'ffmpeg.exe'
+    ffmpeg_dest = 'ffmpeg.exe'
+    console = False  # --windowed
+    collect_packages = ['yt_dlp', 'PyQt5', 'PyQt5.QtCore', 'PyQt5.QtGui', 'PyQt5.QtWidgets']
+    hiddenimports = [
+        'PyQt5',
+        'PyQt5.QtCore',
+        'PyQt5.QtGui',
+        'PyQt5.QtWidgets',
+        'yt_dlp',
+        'psutil',
+        'urllib3',
+        'requests',
+    ]
+    excludes = [
+        'tkinter',  # Exclude unnecessary modules
+        'matplotlib',
+        'numpy',
+        'scipy',
+        'PyQt6',  # Exclude PyQt6 to prevent conflicts
+        'PyQt5.Qt3DCore',
+        'PyQt5.Qt3DRender',
+        'PyQt5.Qt3DAnimation',
+        'PyQt5.Qt3DExtras',
+        'PyQt5.QtQuick',
+        'PyQt5.QtQuick3D',
+        'PyQt5.QtQml',
+        'PyQt5.QtWebEngine',
+        'PyQt5.QtWebView',
+        'PyQt5.QtBluetooth',
+        'PyQt5.QtNfc',
+        'PyQt5.QtPositioning',
+        'PyQt5.QtSensors',
+        'PyQt5.QtSerialPort',
+        'PyQt5.QtSpatialAudio',
+        'PyQt5.QtTextToSpeech',
+        'PyQt5.QtWebChannel',
+        'PyQt5.QtWebSockets',
+    ]
+else:  # macOS
+    ffmpeg_name = 'ffmpeg'
+    ffmpeg_dest = 'ffmpeg/ffmpeg'
+    console = True
+    collect_packages = ['yt_dlp', 'PyQt6']
+    # yt-dlp only imports its optional networking backends lazily
+    hiddenimports = ['urllib3', 'requests']
+    excludes = [
+        'tkinter',  # Exclude unnecessary modules
+        'matplotlib',
+        'numpy',
+        'scipy',
+        'test',
+        'unittest',
+        'PyQt5',  # Exclude PyQt5 to prevent conflicts
+    ]
+
+datas = []
+binaries = []
+for package in collect_packages:
+    package_datas, package_binaries, package_hiddenimports = collect_all(package)
+    datas += package_datas
+    binaries += package_binaries
+    hiddenimports += package_hiddenimports
+if sys.platform == "win32":
+    datas += collect_data_files('PyQt5')
+
+a = Analysis(
+    ['main.py'],
+    pathex=[],
+    binaries=binaries,
+    datas=datas,
+    hiddenimports=hiddenimports,
+    hookspath=[],
+    hooksconfig={},
+    runtime_hooks=[],
+    # A tuple, because PyInstaller appends '__main__' to a list in place, which
+    # makes the cached Analysis in build/ look stale on every rebuild
+    excludes=tuple(excludes),
+    noarchive=False,
+)
+
+# Analysis is done; now we actually need FFmpeg. When started by a build
+# script that is still downloading it, wait for the 'ready' line on stdin.
+if os.environ.get('MRC_WAIT_FOR_FFMPEG') == '1':
+    print(f"Waiting for {ffmpeg_name} download to finish...")
+    if sys.stdin.readline().strip() != 'ready':
+        raise SystemExit(f"{ffmpeg_name} download failed, aborting build")
+
+ffmpeg_path = os.path.join(SPECPATH, ffmpeg_name)
+if not os.path.exists(ffmpeg_path):
+    raise SystemExit(f"{ffmpeg_name} not found next to the spec file")
+a.binaries += [(ffmpeg_dest, ffmpeg_path, 'BINARY')]
+
+pyz = PYZ(a.pure)
+
+exe = EXE(
+    pyz,
+    a.scripts,
+    [],
+    exclude_binaries=True,
+    name='MusicRoundsCreator',
+    debug=False,
+    bootloader_ignore_signals=False,
+    strip=False,
+    upx=True,
+    console=console,
+    disable_windowed_traceback=False,
+    argv_emulation=False,
+    target_arch=None,
+    codesign_identity=None,
+    entitlements_file=None,
+)
+
+coll = COLLECT(
+    exe,
+    a.binaries,
+    a.datas,
+    strip=False,
+    upx=True,
+    upx_exclude=[],
+    name='MusicRoundsCreator',
+)
@@ -6,6 +6,7 @@ Creates standalone executables for both macOS and Windows
 
 import os
 import sys
+import importlib.util
 import subprocess
 import platform
 from pathlib import Path
@@ -31,19 +32,25 @@ def check_requirements():
 
 def install_pyinstaller():
     """Install PyInstaller if not already installed"""
-    try:
-        import PyInstaller
+    # find_spec only locates the package instead of importing all of it
+    if importlib.util.find_spec("PyInstaller") is not None:
         print("✅ PyInstaller is already installed")
         return True
-    except ImportError:
-        print("📦 Installing PyInstaller...")
-        try:
-            subprocess.run([sys.executable, '-m', 'pip', 'install', 'pyinstaller'], check=True)
-            print("✅ PyInstaller installed successfully")
-            return True
-        except subprocess.CalledProcessError as e:
-            print(f"❌ Failed to install PyInstaller: {e}")
-            return False
+    
+    print("📦 Installing PyInstaller...")
+    try:
+        # Wheels only: never fall back to building PyInstaller or its deps from sdists
+        subprocess.run([
+            sys.executable, '-m', 'pip', 'install',
+            '--disable-pip-version-check',
+            '--only-binary=:all:',
+            'pyinstaller==6.*'
+        ], check=True, close_fds=False)  # lets CPython use posix_spawn instead of fork+exec
+        print("✅ PyInstaller installed successfully")
+        return True
+    except subprocess.CalledProcessError as e:
+        print(f"❌ Failed to install PyInstaller: {e}")
+        return False
 
 def build_for_platform():
     """Build for the current platform"""
@@ -79,10 +86,12 @@ def main():
         print("\n📦 Distribution packages created:")
         
         # List created files
-        dist_files = list(Path(".").glob("MusicRoundsCreator_*.zip"))
+        with os.scandir(".") as entries:
+            dist_files = [entry.name for entry in entries
+                          if entry.name.startswith("MusicRoundsCreator_") and entry.name.endswith(".zip")]
         if dist_files:
-            for file in dist_files:
-                print(f"   - {file.name}")
+            for name in dist_files:
+                print(f"   - {name}")
         else:
             print("   - Check the 'dist' directory for the executable")
         
@@ -6,109 +6,215 @@ Creates a standalone .app bundle with all dependencies included
 
 import os
 import sys
+import importlib.util
+import json
 import subprocess
 import shutil
-import urllib.request
+import stat
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from io import BytesIO
 from pathlib import Path
 
+import requests
+
+try:
+    from isal import isal_zlib  # Optional: ISA-L accelerated deflate (pip install isal)
+except ImportError:
+    isal_zlib = None
+
+# Read/write FFmpeg archives in 64 KB chunks rather than the 8 KB default
+DOWNLOAD_CHUNK_SIZE = 1 << 16
+
+# Sidecar holding the ETag/Last-Modified of the archive ffmpeg came from
+FFMPEG_CACHE_FILE = "ffmpeg.cache.json"
+
+# Bundle entries that are already compressed (the executable carries
+# PyInstaller's compressed archive); deflating them again only burns CPU
+PRECOMPRESSED_NAMES = {'MusicRoundsCreator', 'base_library.zip'}
+
+# README bundled with the installer ZIP; at ~1 KB it is stored uncompressed,
+# so packaging doesn't spin up a deflate stream for it on every build
+INSTALLER_README = """Music Rounds Creator - macOS
+
+Installation:
+1. Extract this ZIP file to a folder of your choice
+2. Open the extracted MusicRoundsCreator folder and double-click
+   MusicRoundsCreator inside it to run the application
+   (keep the other files in that folder next to it)
+3. If macOS blocks the app:
+   - **Option 1**: Right-click and select "Open" from the context menu
+   - **Option 2**: Go to System Preferences → Privacy & Security → Security section → Click "Open Anyway" next to MusicRoundsCreator
+
+Requirements:
+- macOS 10.14 (Mojave) or later
+- No additional software required (all dependencies included)
+
+Usage:
+1. Enter YouTube URLs and start times
+2. Click "Create Music Round"
+3. Find your ZIP file on the Desktop
+
+For support, contact the developer.
+"""
+
 def download_ffmpeg_macos():
     """Download FFmpeg static build for macOS"""
     print("📦 Downloading FFmpeg for macOS...")
     
     # FFmpeg static build URL for macOS
     ffmpeg_url = "https://evermeet.cx/ffmpeg/getrelease/zip"
-    ffmpeg_zip = "ffmpeg_macos.zip"
     
     try:
         # Download FFmpeg
         print("Downloading FFmpeg static build...")
-        urllib.request.urlretrieve(ffmpeg_url, ffmpeg_zip)
+        headers = {"Accept-Encoding": "identity"}
         
-        # Extract FFmpeg
-        print("Extracting FFmpeg...")
-        with zipfile.ZipFile(ffmpeg_zip, 'r') as zip_ref:
-            zip_ref.extractall("ffmpeg_temp")
+        # Revalidate a previously downloaded binary instead of fetching it again
+        if Path("ffmpeg").exists() and Path(FFMPEG_CACHE_FILE).exists():
+            with open(FFMPEG_CACHE_FILE, 'r') as f:
+                cached = json.load(f)
+            if cached.get('etag'):
+                headers["If-None-Match"] = cached['etag']
+            if cached.get('last_modified'):
+                headers["If-Modified-Since"] = cached['last_modified']
         
-        # Find ffmpeg binary
-        ffmpeg_bin = None
-        for root, dirs, files in os.walk("ffmpeg_temp"):
-            if "ffmpeg" in files and not files[files.index("ffmpeg")].endswith('.dylib'):
-                ffmpeg_bin = os.path.join(root, "ffmpeg")
-                break
+        # Keep the archive in memory rather than writing it to disk and reading it back
+        archive = BytesIO()
+        # A session keeps the connection alive across the release redirects
+        with requests.Session() as session:
+            with session.get(ffmpeg_url, headers=headers, stream=True, timeout=60) as response:
+                if response.status_code == 304:
+                    print("✅ FFmpeg is up to date, skipping download")
+                    return True
+                response.raise_for_status()
+                
+                for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                    archive.write(chunk)
+                validators = {
+                    'etag': response.headers.get("ETag"),
+                    'last_modified': response.headers.get("Last-Modified"),
+                }
         
-        if ffmpeg_bin:
-            # Copy to current directory
-            shutil.copy2(ffmpeg_bin, "ffmpeg")
-            # Make executable
-            os.chmod("ffmpeg", 0o755)
-            print("✅ FFmpeg downloaded and extracted successfully")
+        # Extract only the ffmpeg binary instead of the whole archive
+        print("Extracting FFmpeg...")
+        with zipfile.ZipFile(archive, 'r') as zip_ref:
+            ffmpeg_member = next(
+                (name for name in zip_ref.namelist() if name == "ffmpeg" or name.endswith("/ffmpeg")),
+                None
+            )
+            if ffmpeg_member is None:
+                print("❌ Could not find ffmpeg binary in downloaded archive")
+                return False
             
-            # Clean up
-            shutil.rmtree("ffmpeg_temp", ignore_errors=True)
-            os.remove(ffmpeg_zip)
-            return True
+            # Write to a temporary name and swap it in, so a build running
+            # alongside the download never picks up a half-written binary
+            with zip_ref.open(ffmpeg_member) as src, open("ffmpeg.part", "wb", buffering=DOWNLOAD_CHUNK_SIZE) as dst:
+                shutil.copyfileobj(src, dst, length=DOWNLOAD_CHUNK_SIZE)
+        
+        # Make executable
+        os.chmod("ffmpeg.part", 0o755)
+        os.replace("ffmpeg.part", "ffmpeg")
+        print("✅ FFmpeg downloaded and extracted successfully")
+        
+        # Remember the archive version so the next build can skip the download.
+        # Without a validator there is nothing to revalidate with, and a sidecar
+        # would only make every later build download the archive again.
+        if any(validators.values()):
+            with open(FFMPEG_CACHE_FILE, 'w') as f:
+                json.dump(validators, f)
         else:
-            print("❌ Could not find ffmpeg binary in downloaded archive")
-            return False
+            Path(FFMPEG_CACHE_FILE).unlink(missing_ok=True)
+        return True
             
     except Exception as e:
+        if Path("ffmpeg").exists():
+            print(f"⚠️ Could not check for a newer FFmpeg ({e}), using the existing binary")
+            return True
         print(f"❌ Failed to download FFmpeg: {e}")
         return False
 
 def install_pyinstaller():
     """Install PyInstaller if not already installed"""
-    try:
-        import PyInstaller
+    # find_spec only locates the package instead of importing all of it
+    if importlib.util.find_spec("PyInstaller") is not None:
         print("✅ PyInstaller is already installed")
         return True
-    except ImportError:
-        print("📦 Installing PyInstaller...")
-        try:
-            subprocess.run([sys.executable, '-m', 'pip', 'install', 'pyinstaller'], check=True)
-            print("✅ PyInstaller installed successfully")
-            return True
-        except subprocess.CalledProcessError as e:
-            print(f"❌ Failed to install PyInstaller: {e}")
-            return False
+    
+    print("📦 Installing PyInstaller...")
+    try:
+        # Wheels only: never fall back to building PyInstaller or its deps from sdists
+        subprocess.run([
+            sys.executable, '-m', 'pip', 'install',
+            '--disable-pip-version-check',
+            '--only-binary=:all:',
+            'pyinstaller==6.*'
+        ], check=True, close_fds=False)  # lets CPython use posix_spawn instead of fork+exec
+        print("✅ PyInstaller installed successfully")
+        return True
+    except subprocess.CalledProcessError as e:
+        print(f"❌ Failed to install PyInstaller: {e}")
+        return False
 
-def build_app():
-    """Build the macOS app bundle"""
+def build_app(ffmpeg_download=None):
+    """Build the macOS app bundle
+    
+    If ffmpeg_download (a Future) is given, PyInstaller runs its analysis
+    while FFmpeg is still downloading and only waits for it before collecting.
+    """
     print("🔨 Building macOS app bundle...")
     
     # Ensure we have FFmpeg
-    if not Path("ffmpeg").exists():
+    if ffmpeg_download is None and not Path("ffmpeg").exists():
         if not download_ffmpeg_macos():
             return False
     
-    # PyInstaller command for macOS
-    cmd = [
-        'pyinstaller',
-        '--onefile',  # Use onefile for simplicity
-        '--name=MusicRoundsCreator',
-        '--add-binary=ffmpeg:ffmpeg',  # Include FFmpeg binary
-        '--hidden-import=PyQt6',
-        '--hidden-import=PyQt6.QtCore',
-        '--hidden-import=PyQt6.QtGui',
-        '--hidden-import=PyQt6.QtWidgets',
-        '--hidden-import=yt_dlp',
-        '--hidden-import=pydub',
-        '--hidden-import=psutil',
-        '--hidden-import=urllib3',
-        '--hidden-import=requests',
-        '--collect-all=yt_dlp',
-        '--collect-all=pydub',
-        'main.py'
-    ]
+    # PyInstaller command - all build options live in the spec file
+    cmd = ['pyinstaller', '--noconfirm', 'MusicRoundsCreator.spec']
+    
+    env = dict(os.environ)
+    if ffmpeg_download is not None:
+        env['MRC_WAIT_FOR_FFMPEG'] = '1'
     
     try:
-        subprocess.run(cmd, check=True)
+        process = subprocess.Popen(cmd, env=env, stdin=subprocess.PIPE if ffmpeg_download else None)
+        
+        if ffmpeg_download is not None:
+            if not ffmpeg_download.result():
+                process.terminate()
+                process.wait()
+                return False
+            # Let the spec know FFmpeg is on disk so it can collect the bundle
+            try:
+                process.stdin.write(b"ready\n")
+                process.stdin.close()
+            except OSError:
+                pass  # PyInstaller already exited, its return code says why
+        
+        returncode = process.wait()
+        if returncode != 0:
+            raise subprocess.CalledProcessError(returncode, cmd)
         print("✅ App bundle created successfully!")
         return True
     except subprocess.CalledProcessError as e:
         print(f"❌ Build failed: {e}")
         return False
 
+@contextmanager
+def fast_deflate():
+    """Use ISA-L's deflate for zipfile compression while active, if installed"""
+    if isal_zlib is None:
+        yield
+        return
+    
+    original_zlib = zipfile.zlib
+    zipfile.zlib = isal_zlib
+    try:
+        yield
+    finally:
+        zipfile.zlib = original_zlib
+
 def create_installer():
     """Create a DMG-like installer package"""
     print("📦 Creating installer package...")
@@ -120,35 +226,24 @@ def create_installer():
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         zip_name = f"MusicRoundsCreator_macOS_{timestamp}.zip"
         
-        with zipfile.ZipFile(zip_name, 'w', zipfile.ZIP_DEFLATED) as zipf:
-            # Add the executable
-            exe_path = Path('dist/MusicRoundsCreator')
-            if exe_path.exists():
-                zipf.write(exe_path, exe_path.name)
+        with fast_deflate(), zipfile.ZipFile(zip_name, 'w', zipfile.ZIP_DEFLATED) as zipf:
+            # Add the app folder, keeping the Qt framework symlinks as links
+            app_dir = Path('dist/MusicRoundsCreator')
+            for root, dirs, files in os.walk(app_dir):
+                for name in dirs + files:
+                    path = Path(root) / name
+                    arcname = str(path.relative_to(app_dir.parent))
+                    if path.is_symlink():
+                        link_info = zipfile.ZipInfo(arcname)
+                        link_info.create_system = 3  # Unix, so the mode bits are honoured
+                        link_info.external_attr = (stat.S_IFLNK | 0o755) << 16
+                        zipf.writestr(link_info, os.readlink(path))
+                    elif path.is_file():
+                        compress_type = zipfile.ZIP_STORED if name in PRECOMPRESSED_NAMES else zipfile.ZIP_DEFLATED
+                        zipf.write(path, arcname, compress_type=compress_type)
             
             # Add README
-            readme_content = """Music Rounds Creator - macOS
-
-Installation:
-1. Extract this ZIP file to a folder of your choice
-2. Double-click MusicRoundsCreator to run the application
-3. If macOS blocks the app:
-   - **Option 1**: Right-click and select "Open" from the context menu
-   - **Option 2**: Go to System Preferences → Privacy & Security → Security section → Click "Open Anyway" next to MusicRoundsCreator
-
-Requirements:
-- macOS 10.14 (Mojave) or later
-- No additional software required (all dependencies included)
-
-Usage:
-1. Enter YouTube URLs and start times
-2. Click "Create Music Round"
-3. Find your ZIP file on the Desktop
-
-For support, contact the developer.
-"""
-            
-            zipf.writestr("README.txt", readme_content)
+            zipf.writestr("README.txt", INSTALLER_README, compress_type=zipfile.ZIP_STORED)
         
         print(f"✅ Created installer: {zip_name}")
         return True
@@ -165,19 +260,27 @@ def main():
         print("❌ This script is for macOS only")
         return False
     
-    # Install PyInstaller
-    if not install_pyinstaller():
-        return False
-    
-    # Build the app
-    if not build_app():
-        return False
+    # Download FFmpeg in the background while PyInstaller is installed and
+    # then runs its analysis - neither needs the binary until the very end
+    # (an existing binary is only rechecked when we know which version it is)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        ffmpeg_download = None
+        if not Path("ffmpeg").exists() or Path(FFMPEG_CACHE_FILE).exists():
+            ffmpeg_download = executor.submit(download_ffmpeg_macos)
+        
+        # Install PyInstaller
+        if not install_pyinstaller():
+            return False
+        
+        # Build the app
+        if not build_app(ffmpeg_download):
+            return False
     
     # Create installer
     create_installer()
     
     print("🎉 Build process completed!")
-    print("📁 Your app is in the 'dist' directory")
+    print("📁 Your app is in the 'dist/MusicRoundsCreator' directory")
     print("📦 Installer package created in current directory")
     return True
 
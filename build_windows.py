@@ -6,136 +6,210 @@ Creates a standalone .exe with all dependencies included
 
 import os
 import sys
+import importlib.util
+import json
 import subprocess
 import shutil
-import urllib.request
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from io import BytesIO
 from pathlib import Path
 
+import requests
+
+try:
+    from isal import isal_zlib  # Optional: ISA-L accelerated deflate (pip install isal)
+except ImportError:
+    isal_zlib = None
+
+# Read/write FFmpeg archives in 64 KB chunks rather than the 8 KB default
+DOWNLOAD_CHUNK_SIZE = 1 << 16
+
+# Sidecar holding the ETag/Last-Modified of the archive ffmpeg.exe came from
+FFMPEG_CACHE_FILE = "ffmpeg.exe.cache.json"
+
+# Bundle entries that are already compressed (the executable carries
+# PyInstaller's compressed archive); deflating them again only burns CPU
+PRECOMPRESSED_NAMES = {'MusicRoundsCreator.exe', 'base_library.zip'}
+
+# README bundled with the installer ZIP; at ~1 KB it is stored uncompressed,
+# so packaging doesn't spin up a deflate stream for it on every build
+INSTALLER_README = """Music Rounds Creator - Windows
+
+Installation:
+1. Extract this ZIP file to a folder of your choice
+2. Open the extracted MusicRoundsCreator folder and double-click
+   MusicRoundsCreator.exe inside it to run the application
+   (keep the other files in that folder next to it)
+3. If Windows SmartScreen blocks the app, click "More info" then "Run anyway"
+
+Requirements:
+- Windows 10 or later
+- No additional software required (all dependencies included)
+
+Usage:
+1. Enter YouTube URLs and start times
+2. Click "Create Music Round"
+3. Find your ZIP file on the Desktop
+
+For support, contact the developer.
+"""
+
 def download_ffmpeg_windows():
     """Download FFmpeg static build for Windows"""
     print("📦 Downloading FFmpeg for Windows...")
     
     # FFmpeg static build URL for Windows
     ffmpeg_url = "https://github.com/BtbN/FFmpeg-Builds/releases/download/latest/ffmpeg-master-latest-win64-gpl.zip"
-    ffmpeg_zip = "ffmpeg_windows.zip"
     
     try:
         # Download FFmpeg
         print("Downloading FFmpeg static build...")
-        urllib.request.urlretrieve(ffmpeg_url, ffmpeg_zip)
+        headers = {"Accept-Encoding": "identity"}
         
-        # Extract FFmpeg
-        print("Extracting FFmpeg...")
-        with zipfile.ZipFile(ffmpeg_zip, 'r') as zip_ref:
-            zip_ref.extractall("ffmpeg_temp")
+        # Revalidate a previously downloaded binary instead of fetching it again
+        if Path("ffmpeg.exe").exists() and Path(FFMPEG_CACHE_FILE).exists():
+            with open(FFMPEG_CACHE_FILE, 'r') as f:
+                cached = json.load(f)
+            if cached.get('etag'):
+                headers["If-None-Match"] = cached['etag']
+            if cached.get('last_modified'):
+                headers["If-Modified-Since"] = cached['last_modified']
         
-        # Find ffmpeg.exe
-        ffmpeg_exe = None
-        for root, dirs, files in os.walk("ffmpeg_temp"):
-            if "ffmpeg.exe" in files:
-                ffmpeg_exe = os.path.join(root, "ffmpeg.exe")
-                break
+        # Keep the archive in memory rather than writing it to disk and reading it back
+        archive = BytesIO()
+        # A session keeps the connection alive across the release redirects
+        with requests.Session() as session:
+            with session.get(ffmpeg_url, headers=headers, stream=True, timeout=60) as response:
+                if response.status_code == 304:
+                    print("✅ FFmpeg is up to date, skipping download")
+                    return True
+                response.raise_for_status()
+                
+                for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                    archive.write(chunk)
+                validators = {
+                    'etag': response.headers.get("ETag"),
+                    'last_modified': response.headers.get("Last-Modified"),
+                }
         
-        if ffmpeg_exe:
-            # Copy to current directory
-            shutil.copy2(ffmpeg_exe, "ffmpeg.exe")
-            print("✅ FFmpeg downloaded and extracted successfully")
+        # Extract only ffmpeg.exe instead of the whole archive
+        print("Extracting FFmpeg...")
+        with zipfile.ZipFile(archive, 'r') as zip_ref:
+            ffmpeg_member = next(
+                (name for name in zip_ref.namelist() if name == "ffmpeg.exe" or name.endswith("/ffmpeg.exe")),
+                None
+            )
+            if ffmpeg_member is None:
+                print("❌ Could not find ffmpeg.exe in downloaded archive")
+                return False
             
-            # Clean up
-            shutil.rmtree("ffmpeg_temp", ignore_errors=True)
-            os.remove(ffmpeg_zip)
-            return True
+            # Write to a temporary name and swap it in, so a build running
+            # alongside the download never picks up a half-written binary
+            with zip_ref.open(ffmpeg_member) as src, open("ffmpeg.exe.part", "wb", buffering=DOWNLOAD_CHUNK_SIZE) as dst:
+                shutil.copyfileobj(src, dst, length=DOWNLOAD_CHUNK_SIZE)
+        
+        os.replace("ffmpeg.exe.part", "ffmpeg.exe")
+        print("✅ FFmpeg downloaded and extracted successfully")
+        
+        # Remember the archive version so the next build can skip the download.
+        # Without a validator there is nothing to revalidate with, and a sidecar
+        # would only make every later build download the archive again.
+        if any(validators.values()):
+            with open(FFMPEG_CACHE_FILE, 'w') as f:
+                json.dump(validators, f)
         else:
-            print("❌ Could not find ffmpeg.exe in downloaded archive")
-            return False
+            Path(FFMPEG_CACHE_FILE).unlink(missing_ok=True)
+        return True
             
     except Exception as e:
+        if Path("ffmpeg.exe").exists():
+            print(f"⚠️ Could not check for a newer FFmpeg ({e}), using the existing binary")
+            return True
         print(f"❌ Failed to download FFmpeg: {e}")
         return False
 
 def install_pyinstaller():
     """Install PyInstaller if not already installed"""
-    try:
-        import PyInstaller
+    # find_spec only locates the package instead of importing all of it
+    if importlib.util.find_spec("PyInstaller") is not None:
         print("✅ PyInstaller is already installed")
         return True
-    except ImportError:
-        print("📦 Installing PyInstaller...")
-        try:
-            subprocess.run([sys.executable, '-m', 'pip', 'install', 'pyinstaller'], check=True)
-            print("✅ PyInstaller installed successfully")
-            return True
-        except subprocess.CalledProcessError as e:
-            print(f"❌ Failed to install PyInstaller: {e}")
-            return False
+    
+    print("📦 Installing PyInstaller...")
+    try:
+        # Wheels only: never fall back to building PyInstaller or its deps from sdists
+        subprocess.run([
+            sys.executable, '-m', 'pip', 'install',
+            '--disable-pip-version-check',
+            '--only-binary=:all:',
+            'pyinstaller==6.*'
+        ], check=True)
+        print("✅ PyInstaller installed successfully")
+        return True
+    except subprocess.CalledProcessError as e:
+        print(f"❌ Failed to install PyInstaller: {e}")
+        return False
 
-def build_exe():
-    """Build the Windows executable"""
+def build_exe(ffmpeg_download=None):
+    """Build the Windows executable
+    
+    If ffmpeg_download (a Future) is given, PyInstaller runs its analysis
+    while FFmpeg is still downloading and only waits for it before collecting.
+    """
     print("🔨 Building Windows executable...")
     
     # Ensure we have FFmpeg
-    if not Path("ffmpeg.exe").exists():
+    if ffmpeg_download is None and not Path("ffmpeg.exe").exists():
         if not download_ffmpeg_windows():
             return False
     
-    # PyInstaller command for Windows
-    cmd = [
-        sys.executable, '-m', 'PyInstaller',
-        '--onefile',
-        '--windowed',
-        '--name=MusicRoundsCreator',
-        '--add-binary=ffmpeg.exe;.',  # Include FFmpeg binary
-        '--hidden-import=PyQt5',
-        '--hidden-import=PyQt5.QtCore',
-        '--hidden-import=PyQt5.QtGui',
-        '--hidden-import=PyQt5.QtWidgets',
-        '--hidden-import=yt_dlp',
-        '--hidden-import=pydub',
-        '--hidden-import=psutil',
-        '--hidden-import=urllib3',
-        '--hidden-import=requests',
-        '--collect-all=yt_dlp',
-        '--collect-all=pydub',
-        '--collect-all=PyQt5',
-        '--collect-all=PyQt5.QtCore',
-        '--collect-all=PyQt5.QtGui',
-        '--collect-all=PyQt5.QtWidgets',
-        '--collect-data=PyQt5',
-        '--exclude-module=tkinter',  # Exclude unnecessary modules
-        '--exclude-module=matplotlib',
-        '--exclude-module=numpy',
-        '--exclude-module=scipy',
-        '--exclude-module=PyQt6',  # Exclude PyQt6 to prevent conflicts
-        '--exclude-module=PyQt5.Qt3DCore',
-        '--exclude-module=PyQt5.Qt3DRender',
-        '--exclude-module=PyQt5.Qt3DAnimation',
-        '--exclude-module=PyQt5.Qt3DExtras',
-        '--exclude-module=PyQt5.QtQuick',
-        '--exclude-module=PyQt5.QtQuick3D',
-        '--exclude-module=PyQt5.QtQml',
-        '--exclude-module=PyQt5.QtWebEngine',
-        '--exclude-module=PyQt5.QtWebView',
-        '--exclude-module=PyQt5.QtBluetooth',
-        '--exclude-module=PyQt5.QtNfc',
-        '--exclude-module=PyQt5.QtPositioning',
-        '--exclude-module=PyQt5.QtSensors',
-        '--exclude-module=PyQt5.QtSerialPort',
-        '--exclude-module=PyQt5.QtSpatialAudio',
-        '--exclude-module=PyQt5.QtTextToSpeech',
-        '--exclude-module=PyQt5.QtWebChannel',
-        '--exclude-module=PyQt5.QtWebSockets',
-        'main.py'
-    ]
+    # PyInstaller command - all build options live in the spec file
+    cmd = [sys.executable, '-m', 'PyInstaller', '--noconfirm', 'MusicRoundsCreator.spec']
+    
+    env = dict(os.environ)
+    if ffmpeg_download is not None:
+        env['MRC_WAIT_FOR_FFMPEG'] = '1'
     
     try:
-        subprocess.run(cmd, check=True)
+        process = subprocess.Popen(cmd, env=env, stdin=subprocess.PIPE if ffmpeg_download else None)
+        
+        if ffmpeg_download is not None:
+            if not ffmpeg_download.result():
+                process.terminate()
+                process.wait()
+                return False
+            # Let the spec know FFmpeg is on disk so it can collect the bundle
+            try:
+                process.stdin.write(b"ready\n")
+                process.stdin.close()
+            except OSError:
+                pass  # PyInstaller already exited, its return code says why
+        
+        returncode = process.wait()
+        if returncode != 0:
+            raise subprocess.CalledProcessError(returncode, cmd)
         print("✅ Executable created successfully!")
         return True
     except subprocess.CalledProcessError as e:
         print(f"❌ Build failed: {e}")
         return False
 
+@contextmanager
+def fast_deflate():
+    """Use ISA-L's deflate for zipfile compression while active, if installed"""
+    if isal_zlib is None:
+        yield
+        return
+    
+    original_zlib = zipfile.zlib
+    zipfile.zlib = isal_zlib
+    try:
+        yield
+    finally:
+        zipfile.zlib = original_zlib
+
 def create_installer():
     """Create a simple installer package"""
     print("📦 Creating installer package...")
@@ -147,33 +221,17 @@ def create_installer():
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         zip_name = f"MusicRoundsCreator_Windows_{timestamp}.zip"
         
-        with zipfile.ZipFile(zip_name, 'w', zipfile.ZIP_DEFLATED) as zipf:
-            # Add the executable
-            exe_path = Path('dist/MusicRoundsCreator.exe')
-            if exe_path.exists():
-                zipf.write(exe_path, exe_path.name)
+        with fast_deflate(), zipfile.ZipFile(zip_name, 'w', zipfile.ZIP_DEFLATED) as zipf:
+            # Add the application folder
+            app_dir = Path('dist/MusicRoundsCreator')
+            for root, dirs, files in os.walk(app_dir):
+                for name in files:
+                    path = Path(root) / name
+                    compress_type = zipfile.ZIP_STORED if name in PRECOMPRESSED_NAMES else zipfile.ZIP_DEFLATED
+                    zipf.write(path, path.relative_to(app_dir.parent), compress_type=compress_type)
             
             # Add README
-            readme_content = """Music Rounds Creator - Windows
-
-Installation:
-1. Extract this ZIP file to a folder of your choice
-2. Double-click MusicRoundsCreator.exe to run the application
-3. If Windows SmartScreen blocks the app, click "More info" then "Run anyway"
-
-Requirements:
-- Windows 10 or later
-- No additional software required (all dependencies included)
-
-Usage:
-1. Enter YouTube URLs and start times
-2. Click "Create Music Round"
-3. Find your ZIP file on the Desktop
-
-For support, contact the developer.
-"""
-            
-            zipf.writestr("README.txt", readme_content)
+            zipf.writestr("README.txt", INSTALLER_README, compress_type=zipfile.ZIP_STORED)
         
         print(f"✅ Created installer: {zip_name}")
         return True
@@ -190,19 +248,27 @@ def main():
         print("❌ This script is for Windows only")
         return False
     
-    # Install PyInstaller
-    if not install_pyinstaller():
-        return False
-    
-    # Build the executable
-    if not build_exe():
-        return False
+    # Download FFmpeg in the background while PyInstaller is installed and
+    # then runs its analysis - neither needs the binary until the very end
+    # (an existing binary is only rechecked when we know which version it is)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        ffmpeg_download = None
+        if not Path("ffmpeg.exe").exists() or Path(FFMPEG_CACHE_FILE).exists():
+            ffmpeg_download = executor.submit(download_ffmpeg_windows)
+        
+        # Install PyInstaller
+        if not install_pyinstaller():
+            return False
+        
+        # Build the executable
+        if not build_exe(ffmpeg_download):
+            return False
     
     # Create installer
     create_installer()
     
     print("🎉 Build process completed!")
-    print("📁 Your executable is in the 'dist' directory")
+    print("📁 Your executable is in the 'dist/MusicRoundsCreator' directory")
     print("📦 Installer package created in current directory")
     return True
 
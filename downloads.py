@@ -0,0 +1,47 @@
+"""
+Download helpers shared by the app and the core test, free of GUI dependencies
+"""
+
+import re
+import threading
+from typing import Dict
+
+import yt_dlp
+
+# How many links are downloaded at the same time
+MAX_PARALLEL_DOWNLOADS = 4
+
+# Anything but letters, digits, spaces, '-' and '_' is dropped from file names
+BAD_TITLE_RE = re.compile(r'[^\w \-]+')
+
+
+class YoutubeDLPool:
+    """Mixin handing out one YoutubeDL per thread and strategy, reused across links
+    
+    Call init_ydls() from __init__ and close_ydls() once the downloads are done.
+    """
+    
+    def init_ydls(self):
+        self.thread_ydls = threading.local()
+        self.open_ydls = []
+        self.ydls_lock = threading.Lock()
+        
+    def get_ydl(self, strategy_index: int, options: Dict) -> yt_dlp.YoutubeDL:
+        """Return this thread's YoutubeDL for a strategy, creating it on first use"""
+        ydls = getattr(self.thread_ydls, 'ydls', None)
+        if ydls is None:
+            ydls = self.thread_ydls.ydls = {}
+        if strategy_index not in ydls:
+            # YoutubeDL keeps and writes to the dict it is given, so hand it a copy
+            ydls[strategy_index] = yt_dlp.YoutubeDL(dict(options))
+            with self.ydls_lock:
+                self.open_ydls.append(ydls[strategy_index])
+        return ydls[strategy_index]
+        
+    def close_ydls(self):
+        """Close every YoutubeDL instance created by get_ydl"""
+        with self.ydls_lock:
+            for ydl in self.open_ydls:
+                ydl.close()
+            self.open_ydls.clear()
+        self.thread_ydls = threading.local()
@@ -6,16 +6,25 @@ A local desktop app for trivia authors to create audio rounds from YouTube links
 
 import sys
 import os
+import errno
+import hashlib
 import json
+import shutil
+import subprocess
 import tempfile
 import zipfile
 import gc
 import time
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Dict, Optional
-from urllib.parse import urlparse, parse_qs
+from urllib.parse import urlparse, parse_qs, urlencode, urlunparse
 
 import yt_dlp
 import sys
@@ -29,7 +38,7 @@ if sys.platform == "darwin":  # macOS
         QSplitter, QFrame, QScrollArea, QGridLayout, QSizePolicy,
         QInputDialog
     )
-    from PyQt6.QtCore import Qt, QThread, pyqtSignal, QTimer
+    from PyQt6.QtCore import Qt, QObject, QThread, pyqtSignal, QTimer
     from PyQt6.QtGui import QFont, QIcon, QPixmap
 else:  # Windows and Linux
     from PyQt5.QtWidgets import (
@@ -39,45 +48,202 @@ else:  # Windows and Linux
         QSplitter, QFrame, QScrollArea, QGridLayout, QSizePolicy,
         QInputDialog
     )
-    from PyQt5.QtCore import Qt, QThread, pyqtSignal, QTimer
+    from PyQt5.QtCore import Qt, QObject, QThread, pyqtSignal, QTimer
     from PyQt5.QtGui import QFont, QIcon, QPixmap
 import psutil
 
+from downloads import YoutubeDLPool, BAD_TITLE_RE, MAX_PARALLEL_DOWNLOADS
 
+# Buffer used when copying clips into the round ZIP
+ZIP_COPY_BUFFER_SIZE = 1024 * 1024
+
+# Seconds the worker collects progress lines before sending them to the UI
+PROGRESS_FLUSH_INTERVAL = 0.1
+
+# yt-dlp metadata is cached so re-clipping a link skips YouTube extraction.
+# The stream URLs inside it expire after about six hours.
+VIDEO_INFO_CACHE_DIR = Path.home() / '.cache' / 'music_rounds'
+VIDEO_INFO_CACHE_TTL = 6 * 60 * 60
+
+# Hosts add_link accepts links from
+YOUTUBE_HOSTS = {'www.youtube.com', 'youtube.com', 'm.youtube.com', 'youtu.be'}
+
+# "83", "1:23" or "1:23:45" as (hours, minutes, seconds) groups; like the
+# int() parsing it replaced, spaces around the colons are allowed
+TIMESTAMP_RE = re.compile(r'(?:(?:(\d+)\s*:\s*)?(\d+)\s*:\s*)?(\d+)')
+
+# A font-size declaration inside a widget stylesheet
+FONT_SIZE_RE = re.compile(r'font-size:\s*\d+pt')
+
+# Application-wide dark theme; {size} is the font size in points
+APP_STYLESHEET_TEMPLATE = """
+    QMainWindow {{
+        background-color: #2b2b2b;
+        color: #e6e6e6;
+        font-family: 'Segoe UI', 'Arial', sans-serif;
+        font-size: {size}pt;
+    }}
+    QWidget {{
+        background-color: #2b2b2b;
+        color: #e6e6e6;
+        font-family: 'Segoe UI', 'Arial', sans-serif;
+        font-size: {size}pt;
+    }}
+    QGroupBox {{
+        border: 1px solid #555;
+        border-radius: 5px;
+        margin-top: 1ex;
+        font-weight: bold;
+        font-family: 'Segoe UI', 'Arial', sans-serif;
+        font-size: {size}pt;
+    }}
+    QGroupBox::title {{
+        subcontrol-origin: margin;
+        left: 10px;
+        padding: 0 5px 0 5px;
+        font-family: 'Segoe UI', 'Arial', sans-serif;
+        font-size: {size}pt;
+    }}
+    QLineEdit, QTextEdit, QSpinBox {{
+        background-color: #3b3b3b;
+        border: 1px solid #555;
+        border-radius: 3px;
+        padding: 5px;
+        color: #e6e6e6;
+        font-family: 'Segoe UI', 'Arial', sans-serif;
+        font-size: {size}pt;
+    }}
+    QLineEdit:focus, QTextEdit:focus, QSpinBox:focus {{
+        border: 1px solid #0078d4;
+    }}
+    QPushButton {{
+        background-color: #0078d4;
+        color: white;
+        border: none;
+        padding: 8px 16px;
+        border-radius: 4px;
+        font-weight: bold;
+        font-family: 'Segoe UI', 'Arial', sans-serif;
+        font-size: {size}pt;
+    }}
+    QPushButton:hover {{
+        background-color: #106ebe;
+    }}
+    QPushButton:pressed {{
+        background-color: #005a9e;
+    }}
+    QPushButton:disabled {{
+        background-color: #555;
+        color: #888;
+    }}
+    QLabel {{
+        color: #e6e6e6;
+        font-family: 'Segoe UI', 'Arial', sans-serif;
+        font-size: {size}pt;
+    }}
+    QProgressBar {{
+        border: 1px solid #555;
+        border-radius: 3px;
+        text-align: center;
+        background-color: #3b3b3b;
+        font-family: 'Segoe UI', 'Arial', sans-serif;
+        font-size: {size}pt;
+    }}
+    QProgressBar::chunk {{
+        background-color: #0078d4;
+        border-radius: 2px;
+    }}
+    QStatusBar {{
+        background-color: #2b2b2b;
+        color: #e6e6e6;
+        font-family: 'Segoe UI', 'Arial', sans-serif;
+        font-size: {size}pt;
+    }}
+"""
+
+# Roomier controls for Windows, applied on top of APP_STYLESHEET_TEMPLATE
+WINDOWS_STYLESHEET_TEMPLATE = """
+    QGroupBox::title {{
+        subcontrol-origin: margin;
+        left: 10px;
+        padding: 0 8px 0 8px;
+        font-family: 'Segoe UI', 'Arial', sans-serif;
+        font-size: {size}pt;
+        margin-top: 4px;
+    }}
+    QLabel {{
+        color: #e6e6e6;
+        font-family: 'Segoe UI', 'Arial', sans-serif;
+        font-size: {size}pt;
+        padding: 2px 0px;
+        line-height: 1.4;
+    }}
+    QPushButton {{
+        background-color: #0078d4;
+        color: white;
+        border: none;
+        padding: 10px 20px;
+        border-radius: 4px;
+        font-weight: bold;
+        font-family: 'Segoe UI', 'Arial', sans-serif;
+        font-size: {size}pt;
+        min-height: 20px;
+    }}
+    QSpinBox {{
+        background-color: #3b3b3b;
+        border: 1px solid #555;
+        border-radius: 3px;
+        padding: 6px 8px;
+        color: #e6e6e6;
+        font-family: 'Segoe UI', 'Arial', sans-serif;
+        font-size: {size}pt;
+        min-height: 25px;
+    }}
+    QLineEdit, QTextEdit {{
+        background-color: #3b3b3b;
+        border: 1px solid #555;
+        border-radius: 3px;
+        padding: 6px 8px;
+        color: #e6e6e6;
+        font-family: 'Segoe UI', 'Arial', sans-serif;
+        font-size: {size}pt;
+        min-height: 25px;
+    }}
+"""
+
+# Milliseconds log lines are collected before they are added to the log output
+LOG_FLUSH_INTERVAL_MS = 100
+
+# The log output keeps only this many of the most recent lines
+LOG_MAX_LINES = 2000
+
+# Font size changes are applied once the spin box has been still this long
+FONT_SIZE_DEBOUNCE_MS = 150
+
+
+def app_stylesheet(font_size: int) -> str:
+    """Return the application stylesheet for the given font size"""
+    stylesheet = APP_STYLESHEET_TEMPLATE.format(size=font_size)
+    if sys.platform == "win32":
+        stylesheet += WINDOWS_STYLESHEET_TEMPLATE.format(size=font_size)
+    return stylesheet
+
+
+@lru_cache(maxsize=512)
 def parse_timestamp(timestamp_str: str) -> Optional[int]:
     """Parse timestamp string in format '83' or '1:23' and return seconds"""
     if not timestamp_str:
         return None
         
-    timestamp_str = timestamp_str.strip()
-    
-    # Handle format like "1:23" (minutes:seconds)
-    if ':' in timestamp_str:
-        parts = timestamp_str.split(':')
-        if len(parts) == 2:
-            try:
-                minutes = int(parts[0])
-                seconds = int(parts[1])
-                return minutes * 60 + seconds
-            except ValueError:
-                return None
-        elif len(parts) == 3:
-            # Handle format like "1:23:45" (hours:minutes:seconds)
-            try:
-                hours = int(parts[0])
-                minutes = int(parts[1])
-                seconds = int(parts[2])
-                return hours * 3600 + minutes * 60 + seconds
-            except ValueError:
-                return None
-    
-    # Handle format like "83" (seconds only)
-    try:
-        return int(timestamp_str)
-    except ValueError:
+    # Handles "83" (seconds), "1:23" (minutes:seconds) and "1:23:45" (hours:minutes:seconds)
+    match = TIMESTAMP_RE.fullmatch(timestamp_str.strip())
+    if not match:
         return None
+    hours, minutes, seconds = (int(part) if part else 0 for part in match.groups())
+    return hours * 3600 + minutes * 60 + seconds
 
 
+@lru_cache(maxsize=512)
 def extract_timestamp_from_url(url: str) -> Optional[int]:
     """Extract timestamp from YouTube URL query parameters"""
     try:
@@ -100,294 +266,369 @@ def extract_timestamp_from_url(url: str) -> Optional[int]:
     return None
 
 
-class DownloadWorker(QThread):
+def video_info_cache_path(url: str) -> Path:
+    """Return the metadata cache file for a YouTube URL"""
+    parsed_url = urlparse(url)
+    video_id = parse_qs(parsed_url.query).get('v', [None])[0]
+    if not video_id and parsed_url.hostname == 'youtu.be':
+        video_id = parsed_url.path.strip('/')
+    if not video_id or not re.fullmatch(r'[\w-]+', video_id):
+        video_id = hashlib.sha256(url.encode()).hexdigest()[:16]
+    return VIDEO_INFO_CACHE_DIR / f"{video_id}.json"
+
+
+def load_cached_video_info(url: str) -> Optional[Dict]:
+    """Return the cached yt-dlp info for a URL, or None if missing or expired"""
+    cache_file = video_info_cache_path(url)
+    try:
+        with open(cache_file, 'r', encoding='utf-8') as f:
+            entry = json.load(f)
+    except (OSError, ValueError):
+        return None
+        
+    if time.time() - entry.get('cached_at', 0) > VIDEO_INFO_CACHE_TTL:
+        drop_cached_video_info(url)
+        return None
+    return entry.get('info')
+
+
+def save_cached_video_info(url: str, info: Dict):
+    """Store yt-dlp info for a URL; failing to cache is never an error"""
+    cache_file = video_info_cache_path(url)
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        partial_file = cache_file.with_name(f"{cache_file.name}.{threading.get_ident()}.part")
+        with open(partial_file, 'w', encoding='utf-8') as f:
+            json.dump({'cached_at': time.time(), 'info': info}, f, default=str)
+        os.replace(partial_file, cache_file)
+    except OSError:
+        pass
+
+
+def drop_cached_video_info(url: str):
+    """Forget the cached yt-dlp info for a URL"""
+    try:
+        os.remove(video_info_cache_path(url))
+    except OSError:
+        pass
+
+
+class DownloadWorker(QThread, YoutubeDLPool):
     """Worker thread for downloading and processing YouTube videos"""
     progress = pyqtSignal(str)
+    link_done = pyqtSignal(int, int)  # Links finished, links to process
     error = pyqtSignal(str)
     finished = pyqtSignal(str)
-    memory_update = pyqtSignal(float)
     
-    def __init__(self, links_data: List[Dict], output_dir: str = None):
+    # Strategy 1: yt-dlp only finds the stream, FFmpeg fetches just the clip.
+    # Nothing in it varies per link, so it is built once for the class.
+    _BASE_YDL_OPTS = {
+        'format': 'worstaudio[ext=m4a]/worstaudio[ext=webm]/worstaudio',
+        'quiet': True,
+        'no_warnings': True,
+        'http_headers': {
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+            'Accept-Language': 'en-us,en;q=0.5',
+            'Sec-Fetch-Mode': 'navigate',
+        },
+        'sleep_interval': 0,
+        'max_sleep_interval': 0,
+        'retries': 0,
+        'fragment_retries': 0,
+        'socket_timeout': 15,
+        'extractor_retries': 0,
+        'ignoreerrors': True,
+    }
+    
+    def __init__(self, links_data: List[Dict], output_dir: str = None, verbose: bool = False):
         super().__init__()
         self.links_data = links_data
         self.output_dir = output_dir
+        self.verbose = verbose
         self.is_running = True
+        # Caps how many requests hit YouTube at once
+        self.youtube_slots = threading.Semaphore(MAX_PARALLEL_DOWNLOADS)
+        # YoutubeDL instances are reused across links, one per pool thread
+        self.init_ydls()
+        # Progress lines are sent to the UI in batches, not one signal each
+        self.progress_buffer = []
+        self.progress_lock = threading.Lock()
+        self.progress_flush_timer = None
         
     def run(self):
+        # The finished/error signal is sent last, after every progress line
+        result_signal, result_message = self.error, "No files were successfully processed."
         try:
             # Create temporary directory for processing
             temp_dir = Path(tempfile.mkdtemp(prefix="music_rounds_"))
             output_dir = temp_dir / "output"
             output_dir.mkdir(exist_ok=True)
             
-            self.progress.emit(f"Created temporary directory: {temp_dir}")
-            self.progress.emit(f"Output directory: {output_dir}")
-            self.progress.emit("Starting download process...")
+            self.log(f"Created temporary directory: {temp_dir}")
+            self.log(f"Output directory: {output_dir}")
+            self.log("Starting download process...")
             
             # Set a maximum processing time (10 minutes)
-            start_time = time.time()
             max_processing_time = 600  # 10 minutes
             
-            processed_files = []
-            
-            # Track processed URLs to avoid duplicates
-            processed_urls = set()
-            
+            # Drop duplicate URLs up front, keeping the first occurrence of each
+            unique_links = {}
             for i, link_data in enumerate(self.links_data):
-                if not self.is_running:
-                    break
-                    
-                # Check if we've exceeded the maximum processing time
-                if time.time() - start_time > max_processing_time:
-                    self.error.emit("Processing timeout: exceeded 10 minutes")
-                    break
-                    
-                # Check if we should stop processing
-                if not self.is_running:
-                    self.progress.emit("Processing stopped by user")
-                    break
-                    
-                url = link_data['url']
-                start_time_seconds = link_data['start_time']
-                duration = link_data.get('duration', 15)
-                title = link_data.get('title', f'Track {i+1}')
-                
-                # Skip if we've already processed this URL
-                if url in processed_urls:
-                    self.progress.emit(f"Skipping duplicate URL: {title}")
+                if link_data['url'] in unique_links:
+                    title = link_data.get('title', f'Track {i+1}')
+                    self.log(f"Skipping duplicate URL: {title}")
                     continue
-                    
-                processed_urls.add(url)
-                self.progress.emit(f"Processing {i+1}/{len(self.links_data)}: {title}")
+                unique_links[link_data['url']] = (i, link_data)
+                
+            processed_files = []
+            failed = False
+            
+            # Downloads are independent and network bound, so run several at once
+            executor = ThreadPoolExecutor(max_workers=MAX_PARALLEL_DOWNLOADS)
+            try:
+                futures = {
+                    executor.submit(self.process_link, i, link_data, temp_dir): (i, link_data)
+                    for i, link_data in unique_links.values()
+                }
                 
-                try:
-                    # Download audio
-                    self.progress.emit(f"Downloading audio for: {title}")
-                    self.progress.emit(f"URL: {url}")
-                    self.progress.emit(f"Start time: {start_time_seconds} seconds")
-                    self.progress.emit(f"Duration: {duration} seconds")
-                    result = self.download_youtube_audio(url, temp_dir, i, start_time_seconds, duration)
-                    if result:
-                        audio_file, video_title = result
-                        self.progress.emit(f"Downloaded to: {audio_file}")
+                for future in as_completed(futures, timeout=max_processing_time):
+                    # Check if we should stop processing
+                    if not self.is_running:
+                        self.log("Processing stopped by user")
+                        break
                         
-                        # The downloaded file is already the 15-second clip we need
-                        processed_files.append({
-                            'file': audio_file,
-                            'title': video_title,
-                            'index': i
-                        })
-                        self.progress.emit(f"Added to processing list: {audio_file} with title: {video_title}")
-                    else:
-                        self.progress.emit(f"Failed to download audio for: {title}")
-                        # Don't continue to next iteration, break the loop
+                    try:
+                        file_info = future.result()
+                    except Exception as e:
+                        failed = True
+                        result_message = str(e)
+                        # Don't carry on with the remaining links
                         break
-                            
-                except Exception as e:
-                    self.error.emit(f"Error processing {title}: {str(e)}")
-                    # Don't continue to next iteration, break the loop
-                    break
-                    
-                # Memory cleanup
-                gc.collect()
-                memory_mb = psutil.Process().memory_info().rss / 1024 / 1024
-                self.memory_update.emit(memory_mb)
+                        
+                    if file_info is None:
+                        if self.is_running:
+                            # Links finish in any order, so shipping the rest would leave
+                            # an arbitrary gap in the round; fail the whole batch instead
+                            i, link_data = futures[future]
+                            failed = True
+                            result_message = f"Could not download link {i+1}: {link_data['url']}"
+                        # Don't carry on with the remaining links
+                        break
+                    processed_files.append(file_info)
+                    self.link_done.emit(len(processed_files), len(unique_links))
+            except FuturesTimeoutError:
+                failed = True
+                result_message = "Processing timeout: exceeded 10 minutes"
+            finally:
+                # Let in-flight downloads finish before the temp directory goes away
+                executor.shutdown(wait=True, cancel_futures=True)
                 
-                # Delay between songs
-                if i < len(self.links_data) - 1:
-                    self.progress.emit("Waiting 2 seconds before next song...")
-                    time.sleep(2)
-                    
-            if processed_files and self.is_running:
+            # Downloads finish in any order; keep the round in the order it was entered
+            processed_files.sort(key=lambda file_info: file_info['index'])
+            
+            if processed_files and self.is_running and not failed:
                 # Create output file(s)
-                self.progress.emit(f"Creating output with {len(processed_files)} processed files...")
+                self.log(f"Creating output with {len(processed_files)} processed files...")
                 output_path = self.create_output_file(processed_files)
-                self.progress.emit(f"Output created: {output_path}")
-                self.finished.emit(str(output_path))
-            else:
-                self.error.emit("No files were successfully processed.")
+                self.log(f"Output created: {output_path}")
+                result_signal, result_message = self.finished, str(output_path)
                 
         except Exception as e:
-            self.error.emit(f"Processing failed: {str(e)}")
+            result_signal, result_message = self.error, f"Processing failed: {str(e)}"
         finally:
+            self.close_ydls()
+            # One collection for the whole batch; the info dicts are freed by refcount
+            gc.collect()
+            
             # Cleanup temp directory
             try:
-                import shutil
-                self.progress.emit(f"Cleaning up temporary directory: {temp_dir}")
+                self.log(f"Cleaning up temporary directory: {temp_dir}")
                 shutil.rmtree(temp_dir, ignore_errors=True)
-                self.progress.emit(f"Temporary directory deleted: {temp_dir}")
+                self.log(f"Temporary directory deleted: {temp_dir}")
             except Exception as e:
-                self.progress.emit(f"Warning: Could not clean up temp directory {temp_dir}: {str(e)}")
+                self.log(f"Warning: Could not clean up temp directory {temp_dir}: {str(e)}")
+            self.flush_progress(final=True)
+            result_signal.emit(result_message)
                 
     def stop(self):
         self.is_running = False
         
+    def log(self, message: str):
+        """Queue a progress line; safe to call from any thread"""
+        with self.progress_lock:
+            self.progress_buffer.append(message)
+            if self.progress_flush_timer is None:
+                self.progress_flush_timer = threading.Timer(PROGRESS_FLUSH_INTERVAL, self.flush_progress)
+                self.progress_flush_timer.daemon = True
+                self.progress_flush_timer.start()
+                
+    def flush_progress(self, final: bool = False):
+        """Send every queued progress line to the UI as one signal
+        
+        The signal is emitted under the lock so batches reach the UI in order.
+        With final=True a timer flush that is already running is waited for too.
+        """
+        with self.progress_lock:
+            timer, self.progress_flush_timer = self.progress_flush_timer, None
+            if timer is not None:
+                timer.cancel()
+            messages, self.progress_buffer = self.progress_buffer, []
+            if messages:
+                self.progress.emit("\n".join(messages))
+        if final and timer is not None and timer is not threading.current_thread():
+            timer.join()
+            
+    def process_link(self, i: int, link_data: Dict, temp_dir: Path) -> Optional[Dict]:
+        """Download the clip for one link; runs on a pool thread"""
+        if not self.is_running:
+            return None
+            
+        url = link_data['url']
+        start_time_seconds = link_data['start_time']
+        duration = link_data.get('duration', 15)
+        title = link_data.get('title', f'Track {i+1}')
+        
+        self.log(f"Processing {i+1}/{len(self.links_data)}: {title}")
+        
+        try:
+            # Download audio
+            self.log(f"Downloading audio for: {title}")
+            self.log(f"URL: {url}")
+            self.log(f"Start time: {start_time_seconds} seconds")
+            self.log(f"Duration: {duration} seconds")
+            result = self.download_youtube_audio(url, temp_dir, i, start_time_seconds, duration)
+        except Exception as e:
+            raise Exception(f"Error processing {title}: {str(e)}") from e
+            
+        if not result:
+            self.log(f"Failed to download audio for: {title}")
+            return None
+            
+        audio_file, video_title = result
+        self.log(f"Downloaded to: {audio_file}")
+        self.log(f"Added to processing list: {audio_file} with title: {video_title}")
+        
+        # The downloaded file is already the 15-second clip we need
+        return {
+            'file': audio_file,
+            'title': video_title,
+            'index': i
+        }
+        
     def download_youtube_audio(self, url: str, temp_dir: Path, index: int, start_time: int, duration: int = 15) -> Optional[tuple[str, str]]:
         """Download audio from YouTube URL starting from specific time"""
         output_path = temp_dir / f"temp_{index}"
-        self.progress.emit(f"Download target path: {output_path}")
+        self.log(f"Download target path: {output_path}")
         
         # Check if URL already has a timestamp
         has_url_timestamp = 't=' in url or 'time_continue=' in url
         
         # Always use explicit start time for consistent behavior
-        self.progress.emit(f"Using external downloader with start_time={start_time}s for {duration}-second clip")
-        strategies = [
-            # Strategy 1: Use external downloader with explicit start time
-            {
-                'format': 'worstaudio[ext=m4a]/worstaudio[ext=webm]/worstaudio',
-                'outtmpl': str(output_path),
-                'postprocessors': [{
-                    'key': 'FFmpegExtractAudio',
-                    'preferredcodec': 'mp3',
-                    'preferredquality': '128',
-                }],
-                'quiet': True,
-                'no_warnings': True,
-                'http_headers': {
-                    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-                    'Accept-Language': 'en-us,en;q=0.5',
-                    'Sec-Fetch-Mode': 'navigate',
-                },
-                'sleep_interval': 0,
-                'max_sleep_interval': 0,
-                'retries': 0,
-                'fragment_retries': 0,
-                'socket_timeout': 15,
-                'extractor_retries': 0,
-                'ignoreerrors': True,
-                # Always use external downloader with explicit start time
-                'external_downloader': 'ffmpeg',
-                'external_downloader_args': {
-                    'ffmpeg': ['-ss', str(start_time), '-t', str(duration)]
-                },
-            }
-        ]
+        self.log(f"Clipping with FFmpeg from start_time={start_time}s for {duration}-second clip")
+        strategies = [self._BASE_YDL_OPTS]
         
         for i, strategy in enumerate(strategies):
             # Check if we should stop
             if not self.is_running:
-                self.progress.emit("Download stopped by user")
+                self.log("Download stopped by user")
                 return None
                 
             try:
-                self.progress.emit(f"Trying download strategy {i+1}...")
+                self.log(f"Trying download strategy {i+1}...")
                 
-                with yt_dlp.YoutubeDL(strategy) as ydl:
-                    info = ydl.extract_info(url, download=True)
+                with self.youtube_slots:
+                    info = load_cached_video_info(url)
+                    if info is not None:
+                        self.log("Using cached video info")
+                        if not self.download_clip(info, output_path, start_time, duration):
+                            # The stream URL in the cached info has most likely expired
+                            self.log("Cached video info is stale, extracting again")
+                            drop_cached_video_info(url)
+                            info = None
+                            
+                    if info is None:
+                        ydl = self.get_ydl(i, strategy)
+                        info = ydl.extract_info(url, download=False)
+                        if info:
+                            info = ydl.sanitize_info(info, remove_private_keys=True)
+                        if info:
+                            save_cached_video_info(url, info)
+                            self.download_clip(info, output_path, start_time, duration)
                     
                 # Extract video title
                 video_title = info.get('title', f'Track {index+1}') if info else f'Track {index+1}'
-                self.progress.emit(f"Video title: {video_title}")
+                self.log(f"Video title: {video_title}")
+                    
+                # FFmpeg writes straight to the .mp3, so that is almost always it
+                downloaded_file = str(output_path) + '.mp3'
+                if os.path.exists(downloaded_file):
+                    self.log(f"Found downloaded file: {downloaded_file}")
+                    return (downloaded_file, video_title)
                     
-                # Find the downloaded file
-                self.progress.emit(f"Searching for downloaded file with extensions: .mp3, .m4a, .webm")
-                for ext in ['.mp3', '.m4a', '.webm']:
-                    potential_file = str(output_path) + ext
-                    if os.path.exists(potential_file):
-                        self.progress.emit(f"Found downloaded file: {potential_file}")
-                        return (potential_file, video_title)
+                # Otherwise look through the temp directory once. Other links are
+                # downloading into it at the same time, so only temp_{index}.* counts.
+                self.log(f"Searching for files with pattern: temp_{index}.*")
+                with os.scandir(temp_dir) as entries:
+                    temp_files = [entry.name for entry in entries]
+                for name in temp_files:
+                    if name.startswith(f"temp_{index}.") and os.path.splitext(name)[1] in ('.mp3', '.m4a', '.webm'):
+                        self.log(f"Found file with different naming: {name}")
+                        return (str(temp_dir / name), video_title)
                         
-                # Check for files with different naming patterns
-                self.progress.emit(f"Searching for files with pattern: temp_{index}.*")
-                for file in temp_dir.glob(f"temp_{index}.*"):
-                    if file.suffix in ['.mp3', '.m4a', '.webm']:
-                        self.progress.emit(f"Found file with different naming: {file}")
-                        return (str(file), video_title)
-                
-                # Check for any audio files in temp directory
-                self.progress.emit(f"Searching for any audio files in temp directory")
-                for file in temp_dir.glob("*"):
-                    if file.suffix.lower() in ['.mp3', '.m4a', '.webm', '.aac', '.ogg']:
-                        self.progress.emit(f"Found audio file: {file}")
-                        return (str(file), video_title)
-                
-                # List all files in temp directory for debugging
-                self.progress.emit(f"Listing all files in temp directory for debugging:")
-                for file in temp_dir.glob("*"):
-                    self.progress.emit(f"  - {file.name} ({file.suffix})")
+                if self.verbose:
+                    self.log(f"Listing all files in temp directory for debugging:")
+                    for name in temp_files:
+                        self.log(f"  - {name}")
                         
-                self.progress.emit(f"Strategy {i+1} completed but no file found")
+                self.log(f"Strategy {i+1} completed but no file found")
                         
             except Exception as e:
-                self.progress.emit(f"Strategy {i+1} failed: {str(e)}")
+                self.log(f"Strategy {i+1} failed: {str(e)}")
                 # If this is the last strategy, don't continue
                 if i == len(strategies) - 1:
-                    self.progress.emit("All download strategies exhausted")
+                    self.log("All download strategies exhausted")
                     return None
                 continue
                 
         raise Exception("All download strategies failed")
         
-    def create_audio_clip(self, input_file: str, start_time: int, output_dir: Path, index: int, duration: int = 15) -> Optional[str]:
-        """Create a custom duration audio clip starting from the specified time"""
-        output_file = output_dir / f"{index+1:02d}.mp3"
-        self.progress.emit(f"Creating clip: {input_file} -> {output_file}")
-        self.progress.emit(f"Clip parameters: start={start_time}s, duration={duration}s, format=mp3")
+    def download_clip(self, info: Dict, output_path: Path, start_time: int, duration: int) -> bool:
+        """Fetch and encode just the clip window straight from the stream URL"""
+        if not info.get('url'):
+            self.log("No direct stream URL in video info")
+            return False
+            
+        cmd = ['ffmpeg', '-y']
+        headers = "".join(f"{name}: {value}\r\n" for name, value in info.get('http_headers', {}).items())
+        if headers:
+            cmd += ['-headers', headers]
+        cmd += [
+            '-ss', str(start_time),  # Seek in the stream before reading
+            '-t', str(duration),  # Only read the clip
+            '-i', info['url'],
+            '-vn',
+            '-threads', '1',  # Links already run in parallel; one thread per clip
+            '-c:a', 'libmp3lame',
+            '-b:a', '128k',
+            '-ar', '44100',
+            str(output_path) + '.mp3'
+        ]
         
+        self.log(f"Running FFmpeg on stream for: {info.get('title', output_path.name)}")
         try:
-            # Try direct FFmpeg first (more memory efficient)
-            import subprocess
-            
-            cmd = [
-                'ffmpeg', '-y',  # Overwrite output file
-                '-i', input_file,  # Input file
-                '-ss', str(start_time),  # Start time
-                '-t', str(duration),  # Duration (custom seconds)
-                '-c:a', 'mp3',  # Audio codec
-                '-b:a', '128k',  # Bitrate
-                '-ar', '44100',  # Sample rate
-                str(output_file)  # Output file
-            ]
-            
-            self.progress.emit(f"Running FFmpeg command: {' '.join(cmd)}")
             result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
-            
-            if result.returncode == 0 and output_file.exists():
-                self.progress.emit(f"FFmpeg successfully created clip: {output_file}")
-                return str(output_file)
-            else:
-                self.progress.emit(f"FFmpeg failed (return code: {result.returncode})")
-                if result.stderr:
-                    self.progress.emit(f"FFmpeg error: {result.stderr}")
-                
         except Exception as e:
-            self.progress.emit(f"FFmpeg direct processing failed: {str(e)}")
-            
-        # Fallback to pydub
-        try:
-            from pydub import AudioSegment
-            
-            self.progress.emit("Using pydub fallback for audio processing...")
-            self.progress.emit(f"Loading audio file: {input_file}")
-            audio = AudioSegment.from_file(input_file)
-            
-            # Convert start time from seconds to milliseconds
-            start_ms = start_time * 1000
-            end_ms = start_ms + (15 * 1000)  # 15 seconds
-            
-            self.progress.emit(f"Extracting clip from {start_ms}ms to {end_ms}ms")
-            # Extract the clip
-            clip = audio[start_ms:end_ms]
-            
-            # Export as MP3
-            self.progress.emit(f"Exporting clip to: {output_file}")
-            clip.export(str(output_file), format='mp3', bitrate='128k')
-            
-            # Clean up memory
-            self.progress.emit("Cleaning up pydub memory...")
-            del audio
-            del clip
-            gc.collect()
-            
-            self.progress.emit(f"Pydub successfully created clip: {output_file}")
-            return str(output_file)
-            
-        except Exception as e:
-            self.progress.emit(f"Pydub processing failed: {str(e)}")
-            return None
+            self.log(f"FFmpeg download failed: {str(e)}")
+            return False
             
+        if result.returncode != 0:
+            self.log(f"FFmpeg download failed (return code: {result.returncode})")
+            if result.stderr:
+                self.log(f"FFmpeg error: {result.stderr}")
+            return False
+        return True
+        
     def create_output_file(self, processed_files: List[Dict]) -> str:
         """Create output file(s) - ZIP for multiple files, single file for one file"""
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -404,8 +645,8 @@ class DownloadWorker(QThread):
         else:
             output_dir = Path(self.output_dir)
             
-        self.progress.emit(f"Output directory: {output_dir}")
-        self.progress.emit(f"Files to include: {len(processed_files)}")
+        self.log(f"Output directory: {output_dir}")
+        self.log(f"Files to include: {len(processed_files)}")
         
         if len(processed_files) == 1:
             # Single file - just copy it with a clean name
@@ -414,45 +655,115 @@ class DownloadWorker(QThread):
             title = file_info['title']
             
             # Create a clean filename with better formatting
-            clean_title = "".join(c for c in title if c.isalnum() or c in (' ', '-', '_')).rstrip()
+            clean_title = BAD_TITLE_RE.sub('', title).rstrip()
             # Replace spaces with underscores and limit length
             clean_title = clean_title.replace(' ', '_')[:40]
             output_filename = f"{clean_title}.mp3"
             output_path = output_dir / output_filename
             
-            self.progress.emit(f"Copying single file: {file_path} -> {output_path}")
+            self.log(f"Moving single file: {file_path} -> {output_path}")
             
-            # Copy the file
-            import shutil
-            shutil.copy2(file_path, output_path)
+            # The clip is only a temp file, so a rename is enough on the same disk
+            try:
+                os.replace(file_path, output_path)
+            except OSError as e:
+                if e.errno != errno.EXDEV:
+                    raise
+                shutil.copy2(file_path, output_path)
             
-            self.progress.emit(f"Single file completed: {output_path}")
+            self.log(f"Single file completed: {output_path}")
             return str(output_path)
         else:
             # Multiple files - create ZIP
             zip_filename = f"music_rounds_{timestamp}.zip"
             zip_path = output_dir / zip_filename
-            self.progress.emit(f"Creating ZIP file: {zip_path}")
+            self.log(f"Creating ZIP file: {zip_path}")
             
-            with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
+            # MP3 is already compressed, so deflating it only burns CPU
+            with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_STORED, allowZip64=True) as zipf:
                 for file_info in processed_files:
                     file_path = file_info['file']
                     title = file_info['title']
                     index = file_info['index']
                     
                     # Create a clean filename with better formatting
-                    clean_title = "".join(c for c in title if c.isalnum() or c in (' ', '-', '_')).rstrip()
+                    clean_title = BAD_TITLE_RE.sub('', title).rstrip()
                     # Replace spaces with underscores and limit length
                     clean_title = clean_title.replace(' ', '_')[:40]
                     arcname = f"{index+1:02d}-{clean_title}.mp3"
                     
-                    self.progress.emit(f"Adding to ZIP: {file_path} -> {arcname}")
-                    zipf.write(file_path, arcname)
+                    self.log(f"Adding to ZIP: {file_path} -> {arcname}")
+                    # Stream through a fixed buffer rather than letting zipfile pick one
+                    zinfo = zipfile.ZipInfo.from_file(file_path, arcname)
+                    zinfo.compress_type = zipf.compression
+                    with open(file_path, 'rb') as src, zipf.open(zinfo, 'w', force_zip64=True) as dst:
+                        shutil.copyfileobj(src, dst, length=ZIP_COPY_BUFFER_SIZE)
                     
-            self.progress.emit(f"ZIP file completed: {zip_path}")
+            self.log(f"ZIP file completed: {zip_path}")
             return str(zip_path)
 
 
+class TitleFetcher(QObject):
+    """Looks up video titles while links sit in the list, a few at a time"""
+    title_ready = pyqtSignal(str, str)
+    
+    def __init__(self):
+        super().__init__()
+        # Pasting a batch of links must not open a connection per link at once
+        self.executor = ThreadPoolExecutor(max_workers=MAX_PARALLEL_DOWNLOADS)
+        self.titles = {}  # URL -> title, for links added again later
+        self.pending = set()  # URLs queued or being looked up
+        
+    def fetch(self, url: str):
+        """Emit title_ready for url, looking the title up only if needed"""
+        if url in self.titles:
+            self.title_ready.emit(url, self.titles[url])
+        elif url not in self.pending:
+            self.pending.add(url)
+            self.executor.submit(self.lookup_title, url)
+            
+    def lookup_title(self, url: str):
+        """Runs on a pool thread; the signal is delivered on the GUI thread"""
+        options = {
+            'quiet': True,
+            'no_warnings': True,
+            'skip_download': True,
+            'extract_flat': True,
+            'socket_timeout': 10,
+        }
+        try:
+            with yt_dlp.YoutubeDL(options) as ydl:
+                # process=False skips format selection; only the title is needed here
+                info = ydl.extract_info(url, download=False, process=False)
+        except Exception:
+            info = None
+            
+        title = info.get('title') if info else None
+        if title:
+            self.titles[url] = title
+        # A failed lookup is tried again if the link is added again
+        self.pending.discard(url)
+        if title:
+            self.title_ready.emit(url, title)
+            
+    def shutdown(self):
+        """Drop queued lookups and wait for the running ones"""
+        self.executor.shutdown(wait=True, cancel_futures=True)
+
+
+@dataclass(eq=False)  # Rows are distinct even when they hold the same link
+class LinkRecord:
+    """One row of the links list and the widgets that show it"""
+    __slots__ = ('widget', 'url', 'start_time', 'duration_spinbox', 'number_label', 'info_label', 'title')
+    widget: QWidget
+    url: str
+    start_time: int
+    duration_spinbox: QSpinBox
+    number_label: QLabel
+    info_label: QLabel
+    title: Optional[str]  # Filled in by TitleFetcher
+
+
 class MusicRoundsApp(QMainWindow):
     """Main application window"""
     
@@ -461,6 +772,9 @@ class MusicRoundsApp(QMainWindow):
         self.download_worker = None
         self.selected_output_dir = None
         self.current_font_size = 11  # Default font size
+        self.process = psutil.Process()  # Reused by every memory reading
+        self.styled_labels = []  # Labels whose stylesheet carries a font size
+        self.group_boxes = []  # Restyled on font changes without a widget-tree search
         self.init_ui()
         
     def init_ui(self):
@@ -544,6 +858,7 @@ class MusicRoundsApp(QMainWindow):
             font_label.setStyleSheet(f"font-size: {self.current_font_size}pt; color: #e6e6e6; padding: 4px;")
         else:
             font_label.setStyleSheet(f"font-size: {self.current_font_size}pt; color: #e6e6e6;")
+        self.styled_labels.append(font_label)
         font_control_layout.addWidget(font_label)
         
         # Font size slider
@@ -597,7 +912,12 @@ class MusicRoundsApp(QMainWindow):
                     background: #5a5a5a;
                 }
             """)
-        self.font_size_slider.valueChanged.connect(self.change_font_size)
+        # Restyling is expensive, so wait until the value stops changing
+        self.font_size_timer = QTimer(self)
+        self.font_size_timer.setSingleShot(True)
+        self.font_size_timer.setInterval(FONT_SIZE_DEBOUNCE_MS)
+        self.font_size_timer.timeout.connect(lambda: self.change_font_size(self.font_size_slider.value()))
+        self.font_size_slider.valueChanged.connect(lambda _: self.font_size_timer.start())
         font_control_layout.addWidget(self.font_size_slider)
         
         # Add stretch to push controls to the left
@@ -640,12 +960,13 @@ class MusicRoundsApp(QMainWindow):
             url_layout.setContentsMargins(8, 8, 8, 8)
         
         # Help text (compact)
-        help_label = QLabel("Enter a YouTube URL with a timestamp (e.g., &t=83) or paste a URL and we'll prompt for the start time. You can edit the clip duration (12-20 seconds) for each link in the list below.")
+        help_label = QLabel("Enter a YouTube URL with a timestamp (e.g., &t=83) or paste a URL and we'll prompt for the start time. Separate several URLs with spaces to add them at once. You can edit the clip duration (12-20 seconds) for each link in the list below.")
         help_label.setWordWrap(True)
         if sys.platform == "win32":
             help_label.setStyleSheet(f"color: #aaa; font-size: {self.current_font_size}pt; margin-bottom: 8px; padding: 4px; line-height: 1.3;")
         else:
             help_label.setStyleSheet(f"color: #aaa; font-size: {self.current_font_size}pt; margin-bottom: 6px;")
+        self.styled_labels.append(help_label)
         url_layout.addWidget(help_label)
         
         self.url_input = QLineEdit()
@@ -658,6 +979,7 @@ class MusicRoundsApp(QMainWindow):
         url_layout.addWidget(self.add_button)
         
         layout.addWidget(url_group)
+        self.group_boxes.append(url_group)
         
         # Links list
         links_group = QGroupBox("Links to Process")
@@ -722,6 +1044,7 @@ class MusicRoundsApp(QMainWindow):
             self.links_placeholder.setStyleSheet(f"color: #666; font-style: italic; font-size: {self.current_font_size}pt; padding: 10px;")
         else:
             self.links_placeholder.setStyleSheet(f"color: #666; font-style: italic; font-size: {self.current_font_size}pt;")
+        self.styled_labels.append(self.links_placeholder)
         self.links_placeholder.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.links_layout.addWidget(self.links_placeholder)
         
@@ -730,6 +1053,8 @@ class MusicRoundsApp(QMainWindow):
         
         # Store the link widgets
         self.link_widgets = []
+        self.title_fetcher = TitleFetcher()
+        self.title_fetcher.title_ready.connect(self.update_link_title)
         
         # Clear button
         self.clear_button = QPushButton("Clear All")
@@ -737,6 +1062,7 @@ class MusicRoundsApp(QMainWindow):
         links_layout.addWidget(self.clear_button)
         
         layout.addWidget(links_group)
+        self.group_boxes.append(links_group)
         
         # Process and Stop buttons
         button_layout = QHBoxLayout()
@@ -888,6 +1214,7 @@ class MusicRoundsApp(QMainWindow):
         # Log output
         self.log_output = QTextEdit()
         self.log_output.setReadOnly(True)
+        self.log_output.document().setMaximumBlockCount(LOG_MAX_LINES)
         self.log_output.setSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Expanding)
         self.log_output.setStyleSheet(f"""
             QTextEdit {{
@@ -900,7 +1227,16 @@ class MusicRoundsApp(QMainWindow):
         """)
         output_layout.addWidget(self.log_output, 1)  # Add stretch factor 1
         
+        # Lines are collected and appended together, not one relayout per line
+        self.log_buffer = []
+        self.log_flush_timer = QTimer(self)
+        self.log_flush_timer.setSingleShot(True)
+        self.log_flush_timer.setTimerType(Qt.TimerType.CoarseTimer)
+        self.log_flush_timer.setInterval(LOG_FLUSH_INTERVAL_MS)
+        self.log_flush_timer.timeout.connect(self.flush_log)
+        
         layout.addWidget(output_group)
+        self.group_boxes.append(output_group)
         
         # Memory usage
         memory_group = QGroupBox("System Info")
@@ -918,10 +1254,12 @@ class MusicRoundsApp(QMainWindow):
         
         # Update memory usage periodically
         self.memory_timer = QTimer()
+        self.memory_timer.setTimerType(Qt.TimerType.CoarseTimer)  # No need for a precise tick
         self.memory_timer.timeout.connect(self.update_memory_usage)
-        self.memory_timer.start(2000)  # Update every 2 seconds
+        self.memory_timer.start(5000)  # Update every 5 seconds
         
         layout.addWidget(memory_group)
+        self.group_boxes.append(memory_group)
         
         # Add stretch to make the output panel expand
         layout.addStretch(1)
@@ -929,74 +1267,109 @@ class MusicRoundsApp(QMainWindow):
         return panel
         
     def add_link(self):
-        """Add a link to the processing list"""
-        url = self.url_input.text().strip()
-        if not url:
+        """Add the link(s) in the URL box to the processing list"""
+        text = self.url_input.text().strip()
+        if not text:
             QMessageBox.warning(self, "Warning", "Please enter a YouTube URL")
             return
             
+        # Several URLs can be pasted at once, separated by spaces. One bad URL
+        # or cancelled prompt skips that URL only, not the rest of the batch.
+        entries = []
+        skipped = []
+        for url in text.split():
+            entry = self.prepare_link(url)
+            if entry is None:
+                skipped.append(url)
+            else:
+                entries.append(entry)
+                
+        # Skipped URLs stay in the box so they can be fixed and added again
+        self.url_input.setText(" ".join(skipped))
+        for url in skipped:
+            self.append_log(f"Skipped: {url}")
+        if not entries:
+            return
+            
+        # Add link widget(s) to the list; default duration is 15 seconds
+        if len(entries) == 1:
+            self.add_link_widget(*entries[0], 15)
+        else:
+            self.add_links_batch([(url, start_time, 15) for url, start_time in entries])
+            
+        for url, start_time in entries:
+            # Convert to minutes and seconds for display
+            minutes = start_time // 60
+            seconds = start_time % 60
+            self.append_log(f"Added: {url} (start at {minutes:02d}:{seconds:02d}, duration: 15s)")
+            
+    def prepare_link(self, url: str) -> Optional[tuple[str, int]]:
+        """Validate a URL and work out its start time, asking the user if needed"""
         # Validate URL
-        if "youtube.com" not in url and "youtu.be" not in url:
+        if '://' not in url:
+            url = f"https://{url}"
+        parsed_url = urlparse(url)
+        if parsed_url.hostname not in YOUTUBE_HOSTS:
             QMessageBox.warning(self, "Warning", "Please enter a valid YouTube URL")
-            return
+            return None
             
         # Try to extract timestamp from URL first
         start_time = extract_timestamp_from_url(url)
         
         if start_time is None:
-            self.log_output.append(f"No timestamp found in URL: {url}")
+            self.append_log(f"No timestamp found in URL: {url}")
             # No timestamp in URL, prompt user
             timestamp_str, ok = QInputDialog.getText(
                 self, 
                 "Enter Start Time", 
-                "Enter the start time (e.g., '83' for 1:23 or '1:23'):",
+                f"Enter the start time for {url}\n(e.g., '83' for 1:23 or '1:23'):",
                 text=""
             )
             
             if not ok:
-                self.log_output.append("User cancelled timestamp input")
-                return  # User cancelled
+                self.append_log("User cancelled timestamp input")
+                return None  # User cancelled
                 
             start_time = parse_timestamp(timestamp_str)
             if start_time is None:
-                self.log_output.append(f"Invalid timestamp format: {timestamp_str}")
+                self.append_log(f"Invalid timestamp format: {timestamp_str}")
                 QMessageBox.warning(self, "Warning", "Invalid timestamp format. Please use '83' or '1:23'")
-                return
+                return None
             else:
-                self.log_output.append(f"Parsed timestamp '{timestamp_str}' to {start_time} seconds")
+                self.append_log(f"Parsed timestamp '{timestamp_str}' to {start_time} seconds")
                 # Convert youtube.com URLs to youtu.be format for better compatibility
-                if 'youtube.com/watch?v=' in url:
-                    # Extract video ID
-                    video_id = url.split('watch?v=')[1].split('&')[0]
+                query = parse_qs(parsed_url.query)
+                if parsed_url.hostname != 'youtu.be' and parsed_url.path == '/watch' and 'v' in query:
                     # Create youtu.be URL with timestamp
-                    url = f"https://youtu.be/{video_id}?t={start_time}"
-                    self.log_output.append(f"Converted to youtu.be format: {url}")
+                    video_id = query['v'][0]
+                    url = urlunparse(('https', 'youtu.be', f"/{video_id}", '', urlencode({'t': start_time}), ''))
+                    self.append_log(f"Converted to youtu.be format: {url}")
                 else:
                     # For other formats, just add timestamp
-                    if '?' in url:
-                        url += f"&t={start_time}"
-                    else:
-                        url += f"?t={start_time}"
-                    self.log_output.append(f"Modified URL to include timestamp: {url}")
+                    query['t'] = [str(start_time)]
+                    url = urlunparse(parsed_url._replace(query=urlencode(query, doseq=True)))
+                    self.append_log(f"Modified URL to include timestamp: {url}")
                 # Since we've added the timestamp to the URL, we don't need the separate start_time parameter
                 # The external FFmpeg downloader will use the timestamp from the URL
         else:
             # Timestamp found in URL, use it
-            self.log_output.append(f"Extracted timestamp from URL: {start_time} seconds")
-            
-        # Convert to minutes and seconds for display
-        minutes = start_time // 60
-        seconds = start_time % 60
-        
-        # Add link widget to the list
-        self.add_link_widget(url, start_time, 15)  # Default duration is 15 seconds
+            self.append_log(f"Extracted timestamp from URL: {start_time} seconds")
             
-        # Clear inputs
-        self.url_input.clear()
+        return url, start_time
         
-        self.log_output.append(f"Added: {url} (start at {minutes:02d}:{seconds:02d}, duration: 15s)")
+    def add_links_batch(self, entries: List[tuple[str, int, int]]):
+        """Add several (url, start_time, duration) links with a single relayout"""
+        self.links_scroll.setUpdatesEnabled(False)
+        self.links_widget.setUpdatesEnabled(False)
+        try:
+            for url, start_time, duration in entries:
+                self.add_link_widget(url, start_time, duration, renumber=False)
+        finally:
+            self.links_widget.setUpdatesEnabled(True)
+            self.links_scroll.setUpdatesEnabled(True)
+        self.update_link_numbers()
         
-    def add_link_widget(self, url: str, start_time: int, duration: int):
+    def add_link_widget(self, url: str, start_time: int, duration: int, renumber: bool = True):
         """Add a link widget to the list"""
         # Remove placeholder if this is the first link
         if self.links_placeholder.isVisible():
@@ -1178,28 +1551,40 @@ class MusicRoundsApp(QMainWindow):
             """)
         
         # Store the widget data
-        link_data = {
-            'widget': link_widget,
-            'url': url,
-            'start_time': start_time,
-            'duration_spinbox': duration_spinbox,
-            'number_label': number_label,
-            'info_label': info_label
-        }
+        link_data = LinkRecord(
+            widget=link_widget,
+            url=url,
+            start_time=start_time,
+            duration_spinbox=duration_spinbox,
+            number_label=number_label,
+            info_label=info_label,
+            title=None,
+        )
         
+        link_widget.link_data = link_data  # Lets remove_link_widget skip a search
         self.link_widgets.append(link_data)
         self.links_layout.addWidget(link_widget)
         
         # Update numbering
-        self.update_link_numbers()
+        if renumber:
+            self.update_link_numbers()
+        
+        # Show the real title once it is known
+        self.title_fetcher.fetch(url)
+        
+    def update_link_title(self, url: str, title: str):
+        """Show a fetched video title on every link for that URL"""
+        for link_data in self.link_widgets:
+            if link_data.url == url:
+                minutes = link_data.start_time // 60
+                seconds = link_data.start_time % 60
+                link_data.title = title
+                link_data.info_label.setText(f"{title} | {minutes:02d}:{seconds:02d}")
+                link_data.info_label.setToolTip(url)
         
     def remove_link_widget(self, widget):
         """Remove a link widget from the list"""
-        # Find and remove the widget data
-        for i, link_data in enumerate(self.link_widgets):
-            if link_data['widget'] == widget:
-                self.link_widgets.pop(i)
-                break
+        self.link_widgets.remove(widget.link_data)
         
         # Remove the widget from the layout
         self.links_layout.removeWidget(widget)
@@ -1215,17 +1600,19 @@ class MusicRoundsApp(QMainWindow):
     def update_link_numbers(self):
         """Update the numbering of all link widgets"""
         for i, link_data in enumerate(self.link_widgets):
-            link_data['number_label'].setText(f"{i + 1}.")
+            link_data.number_label.setText(f"{i + 1}.")
         
     def clear_links(self):
         """Clear all links from the list"""
-        # Remove all link widgets
-        for link_data in self.link_widgets[:]:  # Copy the list to avoid modification during iteration
-            self.remove_link_widget(link_data['widget'])
+        # Remove all link widgets in one pass; item 0 is the placeholder, so keep it
+        while self.links_layout.count() > 1:
+            item = self.links_layout.takeAt(self.links_layout.count() - 1)
+            item.widget().deleteLater()
+        self.link_widgets.clear()
         
         # Show placeholder
         self.links_placeholder.setVisible(True)
-        self.log_output.append("Cleared all links")
+        self.append_log("Cleared all links")
         
     def browse_output_dir(self):
         """Browse for output directory"""
@@ -1233,7 +1620,7 @@ class MusicRoundsApp(QMainWindow):
         if dir_path:
             self.selected_output_dir = dir_path
             self.output_dir_label.setText(dir_path)
-            self.log_output.append(f"Output directory set to: {dir_path}")
+            self.append_log(f"Output directory set to: {dir_path}")
             
     def process_links(self):
         """Process all links in the list"""
@@ -1244,15 +1631,15 @@ class MusicRoundsApp(QMainWindow):
         # Parse links from widgets
         links_data = []
         for i, link_data in enumerate(self.link_widgets):
-            url = link_data['url']
-            start_time = link_data['start_time']
-            duration = link_data['duration_spinbox'].value()
+            url = link_data.url
+            start_time = link_data.start_time
+            duration = link_data.duration_spinbox.value()
             
             links_data.append({
                 'url': url,
                 'start_time': start_time,
                 'duration': duration,
-                'title': f'Track {i+1}'
+                'title': link_data.title or f'Track {i+1}'
             })
                 
         if not links_data:
@@ -1272,43 +1659,46 @@ class MusicRoundsApp(QMainWindow):
         
         # Show progress
         self.progress_bar.setVisible(True)
-        self.progress_bar.setRange(0, 0)  # Indeterminate progress
+        # A fixed range; the busy animation repaints constantly while it runs
+        self.progress_bar.setRange(0, len(links_data))
+        self.progress_bar.setValue(0)
         
         # Clear log
+        self.log_buffer.clear()
         self.log_output.clear()
-        self.log_output.append("Starting processing...")
-        self.log_output.append(f"Processing {len(links_data)} links...")
+        self.append_log("Starting processing...")
+        self.append_log(f"Processing {len(links_data)} links...")
         
         # Log the links being processed
         for i, link_data in enumerate(links_data):
             duration = link_data.get('duration', 15)
-            self.log_output.append(f"Link {i+1}: {link_data['url']} (start at {link_data['start_time']}s, duration: {duration}s)")
+            self.append_log(f"Link {i+1}: {link_data['url']} (start at {link_data['start_time']}s, duration: {duration}s)")
             # Check if this is a manually entered timestamp
             if 't=' not in link_data['url'] and 'time_continue=' not in link_data['url']:
-                self.log_output.append(f"  -> This link has a manually entered timestamp")
+                self.append_log(f"  -> This link has a manually entered timestamp")
         
         # Create and start worker thread
-        output_dir = getattr(self, 'selected_output_dir', None)
+        output_dir = self.selected_output_dir
         self.download_worker = DownloadWorker(links_data, output_dir)
         self.download_worker.progress.connect(self.update_progress)
+        self.download_worker.link_done.connect(self.update_link_progress)
         self.download_worker.error.connect(self.handle_error)
         self.download_worker.finished.connect(self.handle_success)
-        self.download_worker.memory_update.connect(self.update_memory_usage)
         self.download_worker.start()
         
     def stop_processing(self):
         """Stop the processing thread"""
         if self.download_worker and self.download_worker.isRunning():
-            self.log_output.append("Stopping processing...")
+            self.append_log("Stopping processing...")
             self.download_worker.stop()
             
             # Wait for thread to finish with timeout
             if not self.download_worker.wait(5000):  # 5 second timeout
-                self.log_output.append("Force terminating worker thread...")
+                self.append_log("Force terminating worker thread...")
                 self.download_worker.terminate()
                 self.download_worker.wait(2000)  # Wait 2 more seconds
                 
-            self.log_output.append("Processing stopped.")
+            self.append_log("Processing stopped.")
             
         # Re-enable UI
         self.process_button.setEnabled(True)
@@ -1318,14 +1708,35 @@ class MusicRoundsApp(QMainWindow):
         self.progress_bar.setVisible(False)
         self.status_bar.showMessage("Processing stopped")
         
+    def append_log(self, message: str):
+        """Queue a line for the log output; it shows up within LOG_FLUSH_INTERVAL_MS"""
+        self.log_buffer.append(message)
+        if not self.log_flush_timer.isActive():
+            self.log_flush_timer.start()
+            
+    def flush_log(self):
+        """Append every queued line to the log output in one go"""
+        self.log_flush_timer.stop()
+        if self.log_buffer:
+            self.log_output.append("\n".join(self.log_buffer))
+            self.log_buffer.clear()
+            
     def update_progress(self, message: str):
         """Update progress message"""
-        self.log_output.append(message)
-        self.status_bar.showMessage(message)
+        self.append_log(message)
+        # Messages arrive in batches; the status bar shows the latest line
+        self.status_bar.showMessage(message.rsplit("\n", 1)[-1])
+        
+    def update_link_progress(self, done: int, total: int):
+        """Advance the progress bar as links finish"""
+        # Duplicate links are dropped by the worker, so its total can be smaller
+        self.progress_bar.setMaximum(total)
+        self.progress_bar.setValue(done)
         
     def handle_error(self, error: str):
         """Handle processing error"""
-        self.log_output.append(f"ERROR: {error}")
+        self.append_log(f"ERROR: {error}")
+        self.flush_log()
         self.status_bar.showMessage("Processing failed")
         
         # Re-enable UI
@@ -1339,7 +1750,8 @@ class MusicRoundsApp(QMainWindow):
         
     def handle_success(self, zip_path: str):
         """Handle successful processing"""
-        self.log_output.append(f"SUCCESS: Created {zip_path}")
+        self.append_log(f"SUCCESS: Created {zip_path}")
+        self.flush_log()
         self.status_bar.showMessage("Processing completed successfully")
         
         # Re-enable UI
@@ -1356,172 +1768,43 @@ class MusicRoundsApp(QMainWindow):
             f"Music round created successfully!\n\nFile saved to:\n{zip_path}"
         )
         
-    def update_memory_usage(self, memory_mb: float = None):
+    def update_memory_usage(self):
         """Update memory usage display"""
-        if memory_mb is None:
-            memory_mb = psutil.Process().memory_info().rss / 1024 / 1024
+        # Nobody can see the label
+        if self.isMinimized() or not self.isVisible():
+            return
             
+        memory_mb = self.process.memory_info().rss / 1024 / 1024
         self.memory_label.setText(f"Memory Usage: {memory_mb:.1f} MB")
         
     def change_font_size(self, new_size: int):
         """Change the font size throughout the application"""
-        # Get the current application
-        app = QApplication.instance()
+        # Nothing to restyle, e.g. the spin box was stepped away and back
+        if new_size == self.current_font_size:
+            return
         
         # Update the instance variable
         self.current_font_size = new_size
         
-        # Base stylesheet with font size
-        base_stylesheet = f"""
-            QMainWindow {{
-                background-color: #2b2b2b;
-                color: #e6e6e6;
-                font-family: 'Segoe UI', 'Arial', sans-serif;
-                font-size: {new_size}pt;
-            }}
-            QWidget {{
-                background-color: #2b2b2b;
-                color: #e6e6e6;
-                font-family: 'Segoe UI', 'Arial', sans-serif;
-                font-size: {new_size}pt;
-            }}
-            QGroupBox {{
-                border: 1px solid #555;
-                border-radius: 5px;
-                margin-top: 1ex;
-                font-weight: bold;
-                font-family: 'Segoe UI', 'Arial', sans-serif;
-                font-size: {new_size}pt;
-            }}
-            QGroupBox::title {{
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px 0 5px;
-                font-family: 'Segoe UI', 'Arial', sans-serif;
-                font-size: {new_size}pt;
-            }}
-            QLineEdit, QTextEdit, QSpinBox {{
-                background-color: #3b3b3b;
-                border: 1px solid #555;
-                border-radius: 3px;
-                padding: 5px;
-                color: #e6e6e6;
-                font-family: 'Segoe UI', 'Arial', sans-serif;
-                font-size: {new_size}pt;
-            }}
-            QLineEdit:focus, QTextEdit:focus, QSpinBox:focus {{
-                border: 1px solid #0078d4;
-            }}
-            QPushButton {{
-                background-color: #0078d4;
-                color: white;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 4px;
-                font-weight: bold;
-                font-family: 'Segoe UI', 'Arial', sans-serif;
-                font-size: {new_size}pt;
-            }}
-            QPushButton:hover {{
-                background-color: #106ebe;
-            }}
-            QPushButton:pressed {{
-                background-color: #005a9e;
-            }}
-            QPushButton:disabled {{
-                background-color: #555;
-                color: #888;
-            }}
-            QLabel {{
-                color: #e6e6e6;
-                font-family: 'Segoe UI', 'Arial', sans-serif;
-                font-size: {new_size}pt;
-            }}
-            QProgressBar {{
-                border: 1px solid #555;
-                border-radius: 3px;
-                text-align: center;
-                background-color: #3b3b3b;
-                font-family: 'Segoe UI', 'Arial', sans-serif;
-                font-size: {new_size}pt;
-            }}
-            QProgressBar::chunk {{
-                background-color: #0078d4;
-                border-radius: 2px;
-            }}
-            QStatusBar {{
-                background-color: #2b2b2b;
-                color: #e6e6e6;
-                font-family: 'Segoe UI', 'Arial', sans-serif;
-                font-size: {new_size}pt;
-            }}
-        """
-        
-        # Add Windows-specific adjustments to the stylesheet
-        if sys.platform == "win32":
-            windows_adjustments = f"""
-                QGroupBox::title {{
-                    subcontrol-origin: margin;
-                    left: 10px;
-                    padding: 0 8px 0 8px;
-                    font-family: 'Segoe UI', 'Arial', sans-serif;
-                    font-size: {new_size}pt;
-                    margin-top: 4px;
-                }}
-                QLabel {{
-                    color: #e6e6e6;
-                    font-family: 'Segoe UI', 'Arial', sans-serif;
-                    font-size: {new_size}pt;
-                    padding: 2px 0px;
-                    line-height: 1.4;
-                }}
-                QPushButton {{
-                    background-color: #0078d4;
-                    color: white;
-                    border: none;
-                    padding: 10px 20px;
-                    border-radius: 4px;
-                    font-weight: bold;
-                    font-family: 'Segoe UI', 'Arial', sans-serif;
-                    font-size: {new_size}pt;
-                    min-height: 20px;
-                }}
-                QSpinBox {{
-                    background-color: #3b3b3b;
-                    border: 1px solid #555;
-                    border-radius: 3px;
-                    padding: 6px 8px;
-                    color: #e6e6e6;
-                    font-family: 'Segoe UI', 'Arial', sans-serif;
-                    font-size: {new_size}pt;
-                    min-height: 25px;
-                }}
-                QLineEdit, QTextEdit {{
-                    background-color: #3b3b3b;
-                    border: 1px solid #555;
-                    border-radius: 3px;
-                    padding: 6px 8px;
-                    color: #e6e6e6;
-                    font-family: 'Segoe UI', 'Arial', sans-serif;
-                    font-size: {new_size}pt;
-                    min-height: 25px;
-                }}
-            """
-            stylesheet = base_stylesheet + windows_adjustments
-        else:
-            stylesheet = base_stylesheet
-        
-        # Apply the updated global stylesheet
-        app.setStyleSheet(stylesheet)
-        
-        # Update all individual widget stylesheets
+        # Update the global and the individual widget stylesheets
         self.update_widget_font_sizes(new_size)
         
         # Update the log output to show the change
-        self.log_output.append(f"Font size changed to {new_size}pt")
+        self.append_log(f"Font size changed to {new_size}pt")
         
     def update_widget_font_sizes(self, new_size: int):
-        """Update font sizes for all widgets with custom stylesheets"""
+        """Update font sizes for the whole app and all widgets with custom stylesheets"""
+        # Restyle with painting off, so Qt repaints the window once at the end
+        # instead of once per stylesheet change
+        self.setUpdatesEnabled(False)
+        try:
+            QApplication.instance().setStyleSheet(app_stylesheet(new_size))
+            self.apply_widget_font_sizes(new_size)
+        finally:
+            self.setUpdatesEnabled(True)
+        
+    def apply_widget_font_sizes(self, new_size: int):
+        """Set the font size in each widget's own stylesheet"""
         # Update font size slider with Windows-specific adjustments
         if sys.platform == "win32":
             self.font_size_slider.setStyleSheet(f"""
@@ -1566,20 +1849,16 @@ class MusicRoundsApp(QMainWindow):
             """)
         
         # Update group boxes with Windows-specific adjustments
-        for group in self.findChildren(QGroupBox):
+        for group in self.group_boxes:
             if sys.platform == "win32":
                 group.setStyleSheet(f"QGroupBox {{ font-size: {new_size}pt; font-weight: bold; margin-top: 12px; padding-top: 8px; }}")
             else:
                 group.setStyleSheet(f"QGroupBox {{ font-size: {new_size}pt; font-weight: bold; margin-top: 8px; }}")
         
-        # Update help labels and placeholders
-        for label in self.findChildren(QLabel):
-            current_style = label.styleSheet()
-            if "font-size:" in current_style:
-                # Update existing font-size declarations
-                import re
-                new_style = re.sub(r'font-size:\s*\d+pt', f'font-size: {new_size}pt', current_style)
-                label.setStyleSheet(new_style)
+        # Update help labels and placeholders (link rows are updated below)
+        for label in self.styled_labels:
+            # Update existing font-size declarations
+            label.setStyleSheet(FONT_SIZE_RE.sub(f'font-size: {new_size}pt', label.styleSheet()))
         
         # Update log output
         self.log_output.setStyleSheet(f"""
@@ -1672,41 +1951,16 @@ class MusicRoundsApp(QMainWindow):
                 }}
             """)
         
-        # Update links scroll area
-        self.links_scroll.setStyleSheet(f"""
-            QScrollArea {{
-                border: 1px solid #444;
-                border-radius: 4px;
-                background: #1e1e1e;
-            }}
-            QScrollBar:vertical {{
-                background: #2a2a2a;
-                width: 12px;
-                border-radius: 6px;
-            }}
-            QScrollBar::handle:vertical {{
-                background: #555;
-                border-radius: 6px;
-                min-height: 20px;
-            }}
-            QScrollBar::handle:vertical:hover {{
-                background: #666;
-            }}
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{
-                height: 0px;
-            }}
-        """)
-        
         # Update link widgets
         for link_data in self.link_widgets:
             # Update number label
-            link_data['number_label'].setStyleSheet(f"font-weight: bold; color: #888; font-size: {new_size}pt;")
+            link_data.number_label.setStyleSheet(f"font-weight: bold; color: #888; font-size: {new_size}pt;")
             
             # Update info label
-            link_data['info_label'].setStyleSheet(f"color: #e0e0e0; font-size: {new_size}pt; background: transparent; border: none;")
+            link_data.info_label.setStyleSheet(f"color: #e0e0e0; font-size: {new_size}pt; background: transparent; border: none;")
             
             # Update duration spinbox
-            link_data['duration_spinbox'].setStyleSheet(f"""
+            link_data.duration_spinbox.setStyleSheet(f"""
                 QSpinBox {{
                     border: 1px solid #555;
                     border-radius: 2px;
@@ -1747,6 +2001,7 @@ class MusicRoundsApp(QMainWindow):
         if self.download_worker and self.download_worker.isRunning():
             self.download_worker.stop()
             self.download_worker.wait()
+        self.title_fetcher.shutdown()
         event.accept()
 
 
@@ -1758,144 +2013,7 @@ def main():
     app.setStyle('Fusion')
     
     # Apply dark mode styling with responsive fonts for Windows
-    base_stylesheet = """
-        QMainWindow {
-            background-color: #2b2b2b;
-            color: #e6e6e6;
-            font-family: 'Segoe UI', 'Arial', sans-serif;
-            font-size: 11pt;
-        }
-        QWidget {
-            background-color: #2b2b2b;
-            color: #e6e6e6;
-            font-family: 'Segoe UI', 'Arial', sans-serif;
-            font-size: 11pt;
-        }
-        QGroupBox {
-            border: 1px solid #555;
-            border-radius: 5px;
-            margin-top: 1ex;
-            font-weight: bold;
-            font-family: 'Segoe UI', 'Arial', sans-serif;
-            font-size: 11pt;
-        }
-        QGroupBox::title {
-            subcontrol-origin: margin;
-            left: 10px;
-            padding: 0 5px 0 5px;
-            font-family: 'Segoe UI', 'Arial', sans-serif;
-            font-size: 11pt;
-        }
-        QLineEdit, QTextEdit, QSpinBox {
-            background-color: #3b3b3b;
-            border: 1px solid #555;
-            border-radius: 3px;
-            padding: 5px;
-            color: #e6e6e6;
-            font-family: 'Segoe UI', 'Arial', sans-serif;
-            font-size: 11pt;
-        }
-        QLineEdit:focus, QTextEdit:focus, QSpinBox:focus {
-            border: 1px solid #0078d4;
-        }
-        QPushButton {
-            background-color: #0078d4;
-            color: white;
-            border: none;
-            padding: 8px 16px;
-            border-radius: 4px;
-            font-weight: bold;
-            font-family: 'Segoe UI', 'Arial', sans-serif;
-            font-size: 11pt;
-        }
-        QPushButton:hover {
-            background-color: #106ebe;
-        }
-        QPushButton:pressed {
-            background-color: #005a9e;
-        }
-        QPushButton:disabled {
-            background-color: #555;
-            color: #888;
-        }
-        QLabel {
-            color: #e6e6e6;
-            font-family: 'Segoe UI', 'Arial', sans-serif;
-            font-size: 11pt;
-        }
-        QProgressBar {
-            border: 1px solid #555;
-            border-radius: 3px;
-            text-align: center;
-            background-color: #3b3b3b;
-            font-family: 'Segoe UI', 'Arial', sans-serif;
-            font-size: 11pt;
-        }
-        QProgressBar::chunk {
-            background-color: #0078d4;
-            border-radius: 2px;
-        }
-        QStatusBar {
-            background-color: #2b2b2b;
-            color: #e6e6e6;
-            font-family: 'Segoe UI', 'Arial', sans-serif;
-            font-size: 11pt;
-        }
-    """
-    
-    # Add Windows-specific adjustments to the initial stylesheet
-    if sys.platform == "win32":
-        windows_adjustments = """
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 8px 0 8px;
-                font-family: 'Segoe UI', 'Arial', sans-serif;
-                font-size: 11pt;
-                margin-top: 4px;
-            }
-            QLabel {
-                color: #e6e6e6;
-                font-family: 'Segoe UI', 'Arial', sans-serif;
-                font-size: 11pt;
-                padding: 2px 0px;
-                line-height: 1.4;
-            }
-            QPushButton {
-                background-color: #0078d4;
-                color: white;
-                border: none;
-                padding: 10px 20px;
-                border-radius: 4px;
-                font-weight: bold;
-                font-family: 'Segoe UI', 'Arial', sans-serif;
-                font-size: 11pt;
-                min-height: 20px;
-            }
-            QSpinBox {
-                background-color: #3b3b3b;
-                border: 1px solid #555;
-                border-radius: 3px;
-                padding: 6px 8px;
-                color: #e6e6e6;
-                font-family: 'Segoe UI', 'Arial', sans-serif;
-                font-size: 11pt;
-                min-height: 25px;
-            }
-            QLineEdit, QTextEdit {
-                background-color: #3b3b3b;
-                border: 1px solid #555;
-                border-radius: 3px;
-                padding: 6px 8px;
-                color: #e6e6e6;
-                font-family: 'Segoe UI', 'Arial', sans-serif;
-                font-size: 11pt;
-                min-height: 25px;
-            }
-        """
-        app.setStyleSheet(base_stylesheet + windows_adjustments)
-    else:
-        app.setStyleSheet(base_stylesheet)
+    app.setStyleSheet(app_stylesheet(11))
     
     # Create and show main window
     window = MusicRoundsApp()
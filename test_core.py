@@ -5,97 +5,133 @@ Test script for core functionality without GUI dependencies
 
 import sys
 import os
+import importlib.util
+import io
+import mmap
+import random
+import shutil
+import subprocess
 import tempfile
 import zipfile
-import gc
 import time
-from datetime import datetime
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import Dict, Optional
 
-import yt_dlp
-import psutil
+# Add the current directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-class CoreDownloader:
+from downloads import YoutubeDLPool, BAD_TITLE_RE, MAX_PARALLEL_DOWNLOADS
+
+# Where the test output is written
+DESKTOP_DIR = Path.home() / "Desktop"
+
+# Clips up to this size are mapped into memory and handed to the ZIP in one
+# write; anything bigger (or empty, which mmap rejects) goes through zipf.write
+MAX_MMAP_CLIP_SIZE = 64 * 1024 * 1024
+
+# Seconds to wait before the next download strategy: doubles per failed
+# strategy, with jitter so parallel downloads do not retry in lockstep
+RETRY_BASE_DELAY = 0.5
+RETRY_MAX_DELAY = 8
+
+class CoreDownloader(YoutubeDLPool):
     """Core download functionality without GUI dependencies"""
     
+    # Options every download strategy shares
+    _BASE_YDL_OPTS = {
+        'quiet': True,
+        'no_warnings': True,
+        'concurrent_fragment_downloads': 4,
+        'http_chunk_size': 10485760,
+        'socket_timeout': 30,
+    }
+    
+    # What each strategy changes on top of _BASE_YDL_OPTS, tried in order
+    _STRATEGY_OVERRIDES = [
+        # Strategy 1: Standard approach
+        {
+            'format': 'worstaudio[ext=m4a]/worstaudio[ext=webm]/worstaudio',
+            'http_headers': {
+                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+                'Accept-Language': 'en-us,en;q=0.5',
+                'Sec-Fetch-Mode': 'navigate',
+            },
+            'sleep_interval': 2,
+            'max_sleep_interval': 5,
+            'retries': 3,
+            'fragment_retries': 3,
+        },
+        # Strategy 2: Alternative user agent
+        {
+            # An audio-only m4a first; a muxed stream is only the last resort
+            'format': 'worstaudio[ext=m4a]/worstaudio/worst',
+            'http_headers': {
+                'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+                'Accept-Language': 'en-US,en;q=0.9',
+                'Accept-Encoding': 'gzip, deflate, br',
+                'DNT': '1',
+                'Connection': 'keep-alive',
+                'Upgrade-Insecure-Requests': '1',
+            },
+            'sleep_interval': 3,
+            'max_sleep_interval': 8,
+            'retries': 5,
+            'fragment_retries': 5,
+        },
+    ]
+    
     def __init__(self):
         self.is_running = True
+        # YoutubeDL instances are reused across links, one per thread
+        self.init_ydls()
+        # Links that repeat a URL share its download; each URL has its own lock
+        # so a repeat waits for the first download instead of starting another
+        self.url_cache: Dict[str, str] = {}
+        self.url_locks: Dict[str, threading.Lock] = {}
+        self.url_locks_lock = threading.Lock()
         
     def download_youtube_audio(self, url: str, temp_dir: Path, index: int) -> Optional[str]:
-        """Download audio from YouTube URL"""
+        """Download audio from YouTube URL, once per URL"""
+        with self.url_locks_lock:
+            url_lock = self.url_locks.setdefault(url, threading.Lock())
+            
+        with url_lock:
+            cached_file = self.url_cache.get(url)
+            if cached_file and os.path.exists(cached_file):
+                print(f"Reusing download of {url}")
+                return cached_file
+                
+            audio_file = self.fetch_youtube_audio(url, temp_dir, index)
+            self.url_cache[url] = audio_file
+            return audio_file
+            
+    def fetch_youtube_audio(self, url: str, temp_dir: Path, index: int) -> str:
+        """Download audio from YouTube URL, trying each strategy in turn"""
         output_path = temp_dir / f"temp_{index}"
         
-        # Multiple download strategies
-        strategies = [
-            # Strategy 1: Standard approach
-            {
-                'format': 'worstaudio[ext=m4a]/worstaudio[ext=webm]/worstaudio',
-                'outtmpl': str(output_path),
-                'postprocessors': [{
-                    'key': 'FFmpegExtractAudio',
-                    'preferredcodec': 'mp3',
-                    'preferredquality': '128',
-                }],
-                'quiet': True,
-                'no_warnings': True,
-                'http_headers': {
-                    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-                    'Accept-Language': 'en-us,en;q=0.5',
-                    'Sec-Fetch-Mode': 'navigate',
-                },
-                'sleep_interval': 2,
-                'max_sleep_interval': 5,
-                'retries': 3,
-                'fragment_retries': 3,
-            },
-            # Strategy 2: Alternative user agent
-            {
-                'format': 'worstaudio/worst',
-                'outtmpl': str(output_path),
-                'postprocessors': [{
-                    'key': 'FFmpegExtractAudio',
-                    'preferredcodec': 'mp3',
-                    'preferredquality': '128',
-                }],
-                'quiet': True,
-                'no_warnings': True,
-                'http_headers': {
-                    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-                    'Accept-Language': 'en-US,en;q=0.9',
-                    'Accept-Encoding': 'gzip, deflate, br',
-                    'DNT': '1',
-                    'Connection': 'keep-alive',
-                    'Upgrade-Insecure-Requests': '1',
-                },
-                'sleep_interval': 3,
-                'max_sleep_interval': 8,
-                'retries': 5,
-                'fragment_retries': 5,
-            }
-        ]
-        
-        for i, strategy in enumerate(strategies):
+        # The audio is kept as downloaded; create_audio_clip encodes just the
+        # clip, so no full-song MP3 pass here
+        for i, overrides in enumerate(self._STRATEGY_OVERRIDES):
             try:
                 print(f"Trying download strategy {i+1}...")
-                with yt_dlp.YoutubeDL(strategy) as ydl:
-                    info = ydl.extract_info(url, download=True)
-                    
-                # Find the downloaded file
-                for ext in ['.mp3', '.m4a', '.webm']:
-                    potential_file = str(output_path) + ext
-                    if os.path.exists(potential_file):
-                        return potential_file
-                        
-                # Check for files with different naming
-                for file in temp_dir.glob(f"temp_{index}.*"):
-                    if file.suffix in ['.mp3', '.m4a', '.webm']:
-                        return str(file)
-                        
+                ydl = self.get_ydl(i, {**self._BASE_YDL_OPTS, **overrides})
+                # The instance is shared between links; only the target changes
+                ydl.params['outtmpl'] = {'default': str(output_path) + '.%(ext)s'}
+                info = ydl.extract_info(url, download=True)
+                
+                # yt-dlp reports where it saved the file, so there is nothing to search for
+                downloads = info.get('requested_downloads') or [{}]
+                return downloads[0].get('filepath') or ydl.prepare_filename(info)
+                
             except Exception as e:
                 print(f"Strategy {i+1} failed: {str(e)}")
+                if i < len(self._STRATEGY_OVERRIDES) - 1:
+                    delay = RETRY_BASE_DELAY * (2 ** i) * (0.5 + random.random())
+                    time.sleep(min(delay, RETRY_MAX_DELAY))
                 continue
                 
         raise Exception("All download strategies failed")
@@ -104,98 +140,65 @@ class CoreDownloader:
         """Create a custom duration audio clip starting from the specified time"""
         output_file = output_dir / f"{index+1:02d}.mp3"
         
+        # Nothing reads FFmpeg's console, so keep it quiet and off stdin;
+        # -ss before -i seeks straight to start_time instead of decoding up to it,
+        # and a nearby keyframe is close enough for a trivia clip. Downloads are
+        # m4a/webm, so the clip is always encoded, and only the clip.
+        cmd = [
+            'ffmpeg', '-y', '-nostdin', '-loglevel', 'error',
+            '-noaccurate_seek', '-ss', str(start_time), '-i', input_file, '-t', str(duration),
+            '-vn',  # Drop any video stream
+            '-c:a', 'libmp3lame',  # Audio codec
+            '-b:a', '128k',  # Bitrate
+            '-ar', '44100',  # Sample rate
+            '-threads', '1',  # Clips run in parallel, not threads inside one
+            str(output_file)  # Output file
+        ]
+        
         try:
-            # Try direct FFmpeg first (more memory efficient)
-            import subprocess
-            
-            cmd = [
-                'ffmpeg', '-y',  # Overwrite output file
-                '-i', input_file,  # Input file
-                '-ss', str(start_time),  # Start time
-                '-t', str(duration),  # Duration (custom seconds)
-                '-c:a', 'mp3',  # Audio codec
-                '-b:a', '128k',  # Bitrate
-                '-ar', '44100',  # Sample rate
-                str(output_file)  # Output file
-            ]
-            
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
+            # Only the return code is checked, so FFmpeg's output is not collected
+            result = subprocess.run(cmd, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+                                    stderr=subprocess.DEVNULL, timeout=60)
             
             if result.returncode == 0 and output_file.exists():
                 return str(output_file)
-                
-        except Exception as e:
-            print(f"FFmpeg direct processing failed: {str(e)}")
-            
-        # Fallback to pydub
-        try:
-            from pydub import AudioSegment
-            
-            print("Using pydub fallback for audio processing...")
-            audio = AudioSegment.from_file(input_file)
+            print(f"FFmpeg encode failed (return code: {result.returncode})")
             
-            # Convert start time from seconds to milliseconds
-            start_ms = start_time * 1000
-            end_ms = start_ms + (duration * 1000)  # Custom duration
-            
-            # Extract the clip
-            clip = audio[start_ms:end_ms]
-            
-            # Export as MP3
-            clip.export(str(output_file), format='mp3', bitrate='128k')
-            
-            # Clean up memory
-            del audio
-            del clip
-            gc.collect()
+        except Exception as e:
+            print(f"FFmpeg processing failed: {str(e)}")
             
-            return str(output_file)
+        return None
             
-        except Exception as e:
-            print(f"Pydub processing failed: {str(e)}")
-            return None
+    def open_zip_file(self, sink=None) -> tuple[zipfile.ZipFile, Optional[Path]]:
+        """Start a round ZIP on the desktop; clips can be added as they are made
+        
+        With a file-like sink the ZIP is written there instead and no path is returned.
+        """
+        # MP3 is already compressed; deflating it costs CPU and saves nothing
+        if sink is not None:
+            return zipfile.ZipFile(sink, 'w', zipfile.ZIP_STORED), None
             
-    def create_output_file(self, processed_files: List[Dict]) -> str:
-        """Create output file(s) - ZIP for multiple files, single file for one file"""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        # The timestamp only has to keep names unique and in order
+        zip_path = DESKTOP_DIR / f"music_rounds_{time.time_ns()}.zip"
+        return zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_STORED), zip_path
         
-        # Get user's desktop
-        output_dir = Path.home() / "Desktop"
+    def add_to_zip(self, zipf: zipfile.ZipFile, file_info: Dict):
+        """Add one clip to a round ZIP under its numbered name"""
+        file_path = file_info['file']
+        title = file_info['title']
+        index = file_info['index']
         
-        if len(processed_files) == 1:
-            # Single file - just copy it with a clean name
-            file_info = processed_files[0]
-            file_path = file_info['file']
-            title = file_info['title']
-            
-            # Create a clean filename
-            clean_title = "".join(c for c in title if c.isalnum() or c in (' ', '-', '_')).rstrip()
-            output_filename = f"{clean_title[:50]}.mp3"
-            output_path = output_dir / output_filename
-            
-            # Copy the file
-            import shutil
-            shutil.copy2(file_path, output_path)
-            
-            return str(output_path)
-        else:
-            # Multiple files - create ZIP
-            zip_filename = f"music_rounds_{timestamp}.zip"
-            zip_path = output_dir / zip_filename
-            
-            with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-                for file_info in processed_files:
-                    file_path = file_info['file']
-                    title = file_info['title']
-                    index = file_info['index']
-                    
-                    # Create a clean filename
-                    clean_title = "".join(c for c in title if c.isalnum() or c in (' ', '-', '_')).rstrip()
-                    arcname = f"{index+1:02d}_{clean_title[:50]}.mp3"
-                    
-                    zipf.write(file_path, arcname)
-                    
-            return str(zip_path)
+        # Create a clean filename
+        clean_title = BAD_TITLE_RE.sub('', title).rstrip()
+        arcname = f"{index+1:02d}_{clean_title[:50]}.mp3"
+        
+        zinfo = zipfile.ZipInfo.from_file(file_path, arcname)
+        if not 0 < zinfo.file_size <= MAX_MMAP_CLIP_SIZE:
+            zipf.write(file_path, arcname)
+            return
+        zinfo.compress_type = zipf.compression
+        with open(file_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            zipf.writestr(zinfo, mm)
 
 def test_dependencies():
     """Test that all required dependencies are available"""
@@ -203,29 +206,22 @@ def test_dependencies():
     
     dependencies = [
         ('yt-dlp', 'yt_dlp'),
-        ('pydub', 'pydub'),
         ('psutil', 'psutil'),
     ]
     
     missing = []
     for name, module in dependencies:
-        try:
-            __import__(module)
+        # find_spec only locates the module instead of importing all of it
+        if importlib.util.find_spec(module) is not None:
             print(f"✅ {name} is available")
-        except ImportError:
+        else:
             print(f"❌ {name} is missing")
             missing.append(name)
     
-    # Test FFmpeg
-    try:
-        import subprocess
-        result = subprocess.run(['ffmpeg', '-version'], capture_output=True, text=True)
-        if result.returncode == 0:
-            print("✅ FFmpeg is available")
-        else:
-            print("❌ FFmpeg is not working properly")
-            missing.append('FFmpeg')
-    except FileNotFoundError:
+    # Test FFmpeg without starting it
+    if shutil.which('ffmpeg') is not None:
+        print("✅ FFmpeg is available")
+    else:
         print("❌ FFmpeg is not installed")
         missing.append('FFmpeg')
     
@@ -247,80 +243,118 @@ def test_core_functionality():
             'start_time': 30,  # Start at 30 seconds
             'duration': 15,  # 15 second clip
             'title': 'Rick Astley - Never Gonna Give You Up'
+        },
+        # A second link makes the output a ZIP, built while the clips are made
+        {
+            'url': 'https://www.youtube.com/watch?v=9bZkp7q19f0',  # PSY
+            'start_time': 45,  # Start at 45 seconds
+            'duration': 15,  # 15 second clip
+            'title': 'PSY - GANGNAM STYLE'
+        },
+        # The same video again, so it must reuse the first download
+        {
+            'url': 'https://www.youtube.com/watch?v=dQw4w9WgXcQ',  # Rick Astley
+            'start_time': 60,  # Start at 60 seconds
+            'duration': 15,  # 15 second clip
+            'title': 'Rick Astley - Never Gonna Give You Up (chorus)'
         }
     ]
     
     # Create downloader
     downloader = CoreDownloader()
     
-    # Test single download
     temp_dir = Path(tempfile.mkdtemp(prefix="test_"))
     try:
-        print("Testing download...")
-        audio_file = downloader.download_youtube_audio(
-            test_links[0]['url'], 
-            temp_dir, 
-            0
-        )
-        
-        if audio_file and os.path.exists(audio_file):
-            print(f"✅ Download successful: {audio_file}")
+        print(f"Testing download of {len(test_links)} link(s)...")
+        # Downloads are independent and network bound, so run them side by side
+        with ThreadPoolExecutor(max_workers=min(len(test_links), MAX_PARALLEL_DOWNLOADS)) as executor:
+            audio_files = list(executor.map(
+                lambda item: downloader.download_youtube_audio(item[1]['url'], temp_dir, item[0]),
+                enumerate(test_links)
+            ))
             
-            # Test audio clipping
-            output_dir = temp_dir / "output"
-            output_dir.mkdir(exist_ok=True)
+        # A download either returns the saved file or raises
+        for audio_file in audio_files:
+            print(f"✅ Download successful: {audio_file}")
             
-            print("Testing audio clipping...")
-            clip_file = downloader.create_audio_clip(
-                audio_file,
-                test_links[0]['start_time'],
-                output_dir,
-                0,
-                test_links[0]['duration']
-            )
+        # Links sharing a URL must share one download
+        unique_urls = {link['url'] for link in test_links}
+        if len(set(audio_files)) != len(unique_urls):
+            print(f"❌ Expected {len(unique_urls)} downloads, got {len(set(audio_files))}")
+            return False
+        print(f"✅ {len(test_links)} links needed only {len(unique_urls)} downloads")
             
-            if clip_file and os.path.exists(clip_file):
-                print(f"✅ Audio clipping successful: {clip_file}")
-                
-                # Test ZIP creation
-                processed_files = [{
-                    'file': clip_file,
-                    'title': test_links[0]['title'],
-                    'index': 0
-                }]
+        # Test audio clipping
+        output_dir = temp_dir / "output"
+        output_dir.mkdir(exist_ok=True)
+        
+        print("Testing audio clipping...")
+        # The clips go into a ZIP; each is added as soon as it is finished
+        # rather than after the last one. Only this test reads it, so it stays in memory.
+        zip_sink = io.BytesIO()
+        zipf = downloader.open_zip_file(zip_sink)[0]
+        try:
+            # Each clip is its own single-threaded FFmpeg process, so one per core
+            with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+                futures = {
+                    executor.submit(
+                        downloader.create_audio_clip,
+                        audio_file,
+                        link['start_time'],
+                        output_dir,
+                        i,
+                        link['duration']
+                    ): i
+                    for i, (link, audio_file) in enumerate(zip(test_links, audio_files))
+                }
                 
-                print("Testing output creation...")
-                output_path = downloader.create_output_file(processed_files)
-                if os.path.exists(output_path):
-                    print(f"✅ Output creation successful: {output_path}")
+                for future in as_completed(futures):
+                    i = futures[future]
+                    clip_file = future.result()
+                    if not (clip_file and os.path.exists(clip_file)):
+                        print("❌ Audio clipping failed")
+                        return False
+                    print(f"✅ Audio clipping successful: {clip_file}")
                     
-                    # Verify output contents
-                    if output_path.endswith('.zip'):
-                        with zipfile.ZipFile(output_path, 'r') as zipf:
-                            files = zipf.namelist()
-                            print(f"✅ ZIP contains {len(files)} files: {files}")
-                    else:
-                        print(f"✅ Single file created: {output_path}")
-                        
-                    return True
-                else:
-                    print("❌ Output creation failed")
-            else:
-                print("❌ Audio clipping failed")
-        else:
-            print("❌ Download failed")
+                    downloader.add_to_zip(zipf, {
+                        'file': clip_file,
+                        'title': test_links[i]['title'],
+                        'index': i
+                    })
+                    # The ZIP has its own copy now
+                    os.unlink(clip_file)
+        finally:
+            zipf.close()
+                
+        # Test ZIP creation
+        print("Testing output creation...")
+        with zipfile.ZipFile(zip_sink, 'r') as zipf:
+            files = zipf.namelist()
+        if len(files) != len(test_links):
+            print("❌ Output creation failed")
+            return False
+        print(f"✅ ZIP contains {len(files)} files: {files}")
+        return True
             
     except Exception as e:
         print(f"❌ Test failed with error: {e}")
         import traceback
         traceback.print_exc()
     finally:
-        # Cleanup
+        downloader.close_ydls()
+        
+        # Cleanup. The temp dir is flat apart from output/, so its entries are
+        # removed directly; rmtree is only the fallback.
         try:
-            import shutil
+            with os.scandir(temp_dir) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        shutil.rmtree(entry.path, ignore_errors=True)
+                    else:
+                        os.unlink(entry.path)
+            os.rmdir(temp_dir)
+        except OSError:
             shutil.rmtree(temp_dir, ignore_errors=True)
-        except:
-            pass
     
     return False
 
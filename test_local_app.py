@@ -6,15 +6,18 @@ Tests the core functionality without the GUI
 
 import sys
 import os
+import importlib.util
+import shutil
 import tempfile
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 
 # Add the current directory to Python path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from main import DownloadWorker
+from main import DownloadWorker, MAX_PARALLEL_DOWNLOADS, parse_timestamp
 
 def test_download_worker():
     """Test the DownloadWorker class directly"""
@@ -42,73 +45,112 @@ def test_download_worker():
     # Test download functionality
     print("Testing download functionality...")
     
-    # Test single download
     temp_dir = Path(tempfile.mkdtemp(prefix="test_"))
     try:
-        # Test download
-        result = worker.download_youtube_audio(
-            test_links[0]['url'], 
-            temp_dir, 
-            0,
-            test_links[0]['start_time'],
-            test_links[0]['duration']
-        )
-        
-        if result:
-            audio_file, video_title = result
-            if os.path.exists(audio_file):
-                print(f"✅ Download successful: {audio_file}")
+        # Downloads are independent and network bound, so run them side by side
+        with ThreadPoolExecutor(max_workers=min(len(test_links), MAX_PARALLEL_DOWNLOADS)) as executor:
+            results = list(executor.map(
+                lambda item: worker.download_youtube_audio(
+                    item[1]['url'],
+                    temp_dir,
+                    item[0],
+                    item[1]['start_time'],
+                    item[1]['duration']
+                ),
+                enumerate(test_links)
+            ))
             
-            # Test audio clipping
-            output_dir = temp_dir / "output"
-            output_dir.mkdir(exist_ok=True)
+        if not all(results):
+            print("❌ Download failed")
+            return
             
-            clip_file = worker.create_audio_clip(
-                audio_file,
-                test_links[0]['start_time'],
-                output_dir,
-                0
-            )
+        # FFmpeg fetches just the clip window, so each download already is the clip
+        processed_files = []
+        for i, (link, (clip_file, video_title)) in enumerate(zip(test_links, results)):
+            if not os.path.exists(clip_file):
+                print("❌ Download failed")
+                return
+            print(f"✅ Download successful: {clip_file}")
             
-            if clip_file and os.path.exists(clip_file):
-                print(f"✅ Audio clipping successful: {clip_file}")
-                
-                # Test ZIP creation
-                processed_files = [{
-                    'file': clip_file,
-                    'title': test_links[0]['title'],
-                    'index': 0
-                }]
-                
-                output_path = worker.create_output_file(processed_files)
-                if os.path.exists(output_path):
-                    print(f"✅ Output creation successful: {output_path}")
-                    
-                    # Verify output contents
-                    if output_path.endswith('.zip'):
-                        with zipfile.ZipFile(output_path, 'r') as zipf:
-                            files = zipf.namelist()
-                            print(f"✅ ZIP contains {len(files)} files: {files}")
-                    else:
-                        print(f"✅ Single file created: {output_path}")
-                else:
-                    print("❌ Output creation failed")
+            processed_files.append({
+                'file': clip_file,
+                'title': link['title'],
+                'index': i
+            })
+            
+        # Test ZIP creation
+        output_path = worker.create_output_file(processed_files)
+        if os.path.exists(output_path):
+            print(f"✅ Output creation successful: {output_path}")
+            
+            # Verify output contents
+            if output_path.endswith('.zip'):
+                with zipfile.ZipFile(output_path, 'r') as zipf:
+                    files = zipf.namelist()
+                    print(f"✅ ZIP contains {len(files)} files: {files}")
             else:
-                print("❌ Audio clipping failed")
+                print(f"✅ Single file created: {output_path}")
         else:
-            print("❌ Download failed")
+            print("❌ Output creation failed")
             
     except Exception as e:
         print(f"❌ Test failed with error: {e}")
         import traceback
         traceback.print_exc()
     finally:
-        # Cleanup
+        worker.close_ydls()
+        
+        # Cleanup. The temp dir is flat apart from output/, so its entries are
+        # removed directly; rmtree is only the fallback.
         try:
-            import shutil
+            with os.scandir(temp_dir) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        shutil.rmtree(entry.path, ignore_errors=True)
+                    else:
+                        os.unlink(entry.path)
+            os.rmdir(temp_dir)
+        except OSError:
             shutil.rmtree(temp_dir, ignore_errors=True)
-        except:
-            pass
+
+def test_parse_timestamp():
+    """Test parse_timestamp against what the old split/int() parser returned"""
+    print("🧪 Testing timestamp parsing...")
+    
+    # Input -> result of the old parser
+    cases = [
+        ("83", 83),
+        (" 83 ", 83),
+        ("0", 0),
+        ("1:23", 83),
+        ("01:05", 65),
+        ("90:00", 5400),
+        ("1:23:45", 5025),
+        ("1: 23", 83),
+        ("1 :23", 83),
+        ("1 : 23 : 45", 5025),
+        ("", None),
+        ("abc", None),
+        ("1:", None),
+        (":30", None),
+        ("1:2:3:4", None),
+        ("1.5", None),
+    ]
+    # The old parser took these through int(); the new one rejects them on purpose
+    # since a start time is never signed or written with digit separators
+    rejected = ["+5", "-5", "1_0"]
+    
+    failures = 0
+    for text, expected in cases + [(text, None) for text in rejected]:
+        result = parse_timestamp(text)
+        if result != expected:
+            print(f"❌ parse_timestamp({text!r}) returned {result}, expected {expected}")
+            failures += 1
+            
+    if failures:
+        return False
+    print(f"✅ Timestamp parsing matches for {len(cases) + len(rejected)} inputs")
+    return True
 
 def test_dependencies():
     """Test that all required dependencies are available"""
@@ -117,29 +159,22 @@ def test_dependencies():
     dependencies = [
         ('PyQt6', 'PyQt6'),
         ('yt-dlp', 'yt_dlp'),
-        ('pydub', 'pydub'),
         ('psutil', 'psutil'),
     ]
     
     missing = []
     for name, module in dependencies:
-        try:
-            __import__(module)
+        # find_spec only locates the module instead of importing all of it
+        if importlib.util.find_spec(module) is not None:
             print(f"✅ {name} is available")
-        except ImportError:
+        else:
             print(f"❌ {name} is missing")
             missing.append(name)
     
-    # Test FFmpeg
-    try:
-        import subprocess
-        result = subprocess.run(['ffmpeg', '-version'], capture_output=True, text=True)
-        if result.returncode == 0:
-            print("✅ FFmpeg is available")
-        else:
-            print("❌ FFmpeg is not working properly")
-            missing.append('FFmpeg')
-    except FileNotFoundError:
+    # Test FFmpeg without starting it
+    if shutil.which('ffmpeg') is not None:
+        print("✅ FFmpeg is available")
+    else:
         print("❌ FFmpeg is not installed")
         missing.append('FFmpeg')
     
@@ -159,6 +194,10 @@ def main():
     if not test_dependencies():
         return False
     
+    # Test timestamp parsing
+    if not test_parse_timestamp():
+        return False
+    
     # Test core functionality
     test_download_worker()
     